@@ -17,16 +17,10 @@ import os
 import sys
 import json
 import shlex
-import subprocess
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 
-try:
-    import openai
-except Exception:
-    openai = None
-
 try:
     from colorama import init as colorama_init, Fore, Style
     colorama_init(autoreset=True)
@@ -36,22 +30,37 @@ except Exception:
         def __getattr__(self, name): return ""
     Fore = Style = Dummy()
 
-try:
-    import pyperclip
-except Exception:
-    pyperclip = None
-
 # ---------- Configurações ----------
 DATA_DIR = Path.home() / ".auto_assistant"
-DATA_DIR.mkdir(exist_ok=True)
 HISTORY_FILE = DATA_DIR / "history.json"
 MEMORY_FILE = DATA_DIR / "memory.json"
 MAX_CHAT_HISTORY = 20  # quantas mensagens manter em contexto
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")  # use .env or export OPENAI_API_KEY=...
 
-if OPENAI_API_KEY and openai:
-    openai.api_key = OPENAI_API_KEY
+# ---------- Backends opcionais (carregados só no primeiro uso) ----------
+# openai sozinho custa centenas de ms de import; nada disso deve atrasar o prompt.
+_backends: Dict[str, Any] = {}
+
+def _load_backend(name: str):
+    if name not in _backends:
+        try:
+            _backends[name] = __import__(name)
+        except Exception:
+            _backends[name] = None
+    return _backends[name]
+
+def get_openai():
+    """Retorna o módulo openai configurado, ou None se não houver chave/pacote."""
+    if not OPENAI_API_KEY:
+        return None
+    openai = _load_backend("openai")
+    if openai is not None:
+        openai.api_key = OPENAI_API_KEY
+    return openai
+
+def get_pyperclip():
+    return _load_backend("pyperclip")
 
 # ---------- Utilitários I/O ----------
 def load_json(path: Path) -> Any:
@@ -64,6 +73,7 @@ def load_json(path: Path) -> Any:
         return []
 
 def save_json(path: Path, data: Any):
+    path.parent.mkdir(exist_ok=True)
     with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
@@ -98,6 +108,7 @@ def recall_notes(limit: int = 20):
 
 # ---------- Shell Exec ----------
 def run_shell(cmd: str) -> str:
+    import subprocess
     try:
         # cuidado com segurança — este utilitário executará comandos do sistema
         completed = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=30)
@@ -152,7 +163,8 @@ def extractive_summary(text: str, max_sentences: int = 3) -> str:
 
 # ---------- OpenAI wrapper (se opcionalmente disponível) ----------
 def openai_chat(prompt: str, system_prompt: Optional[str] = None) -> Optional[str]:
-    if not (openai and OPENAI_API_KEY):
+    openai = get_openai()
+    if openai is None:
         return None
     try:
         messages = []
@@ -281,7 +293,7 @@ def command_loop():
                 arg0 = args[0]
                 if arg0.startswith("text:"):
                     text = raw.partition("text:")[2]
-                    if OPENAI_API_KEY and openai:
+                    if get_openai():
                         ans = openai_chat(f"Resuma o texto a seguir em 3 frases:\n\n{text}")
                         print(Fore.GREEN + ans)
                         append_history("assistant", "[summarize] text")
@@ -294,7 +306,7 @@ def command_loop():
                         print(Fore.RED + "Arquivo não encontrado:", path)
                         continue
                     text = path.read_text(encoding="utf-8", errors="ignore")
-                    if OPENAI_API_KEY and openai:
+                    if get_openai():
                         ans = openai_chat("Resuma o texto a seguir em 5-7 frases:\n\n" + text)
                         print(Fore.GREEN + ans)
                         append_history("assistant", f"[summarize] {path}")
@@ -302,6 +314,7 @@ def command_loop():
                         print(Fore.GREEN + extractive_summary(text, max_sentences=5))
                         append_history("assistant", f"[summarize] {path} (local)")
             elif cmd == "/copy":
+                pyperclip = get_pyperclip()
                 if pyperclip is None:
                     print(Fore.RED + "pyperclip não instalado. Instale com: pip install pyperclip")
                     continue
@@ -315,7 +328,7 @@ def command_loop():
                     continue
                 prompt = " ".join(args)
                 # try OpenAI
-                if OPENAI_API_KEY and openai:
+                if get_openai():
                     ans = openai_chat(prompt)
                     if ans is None:
                         ans = "(erro ao chamar OpenAI)"
@@ -326,7 +339,7 @@ def command_loop():
                 append_history("assistant", ans)
             elif cmd == "/config":
                 print("Config:")
-                print("  OPENAI API:", bool(OPENAI_API_KEY and openai))
+                print("  OPENAI API:", get_openai() is not None)
                 print(f"  History file: {HISTORY_FILE}")
                 print(f"  Memory file:  {MEMORY_FILE}")
             else:
@@ -340,7 +353,7 @@ def command_loop():
 
         # Prefer OpenAI if disponível
         reply = None
-        if OPENAI_API_KEY and openai:
+        if get_openai():
             reply = openai_chat(user_text)
             if reply is None:
                 reply = "(Erro OpenAI; caindo para fallback)"
@@ -1,7 +1,12 @@
 import random
 import json
 import os
+import sys
+import time
+import argparse
+from collections import deque
 from datetime import datetime
+from multiprocessing import Pool
 from colorama import Fore, Style, init
 
 # inicializa colorama
@@ -25,15 +30,19 @@ MISSÕES = [
     "negociar paz entre facções rivais"
 ]
 RECOMPENSAS = ["ouro", "magia antiga", "armas raras", "conhecimento proibido", "alianças poderosas"]
+NOMES = ["Arin", "Kael", "Lyra", "Mira", "Thorn", "Darian", "Eryn", "Zarek"]
+DIFICULDADES = ["Fácil", "Média", "Difícil", "Épica"]
 
 # ===============================
 # 🔹 Funções
 # ===============================
-def gerar_personagem():
-    nome = random.choice(["Arin", "Kael", "Lyra", "Mira", "Thorn", "Darian", "Eryn", "Zarek"])
-    classe = random.choice(CLASSES)
-    traço = random.choice(TRAÇOS)
-    motivo = random.choice(MOTIVOS)
+# todas as funções aceitam um rng (random.Random) para gerar mundos reproduzíveis;
+# sem rng usam o módulo random global, como antes
+def gerar_personagem(rng=random):
+    nome = rng.choice(NOMES)
+    classe = rng.choice(CLASSES)
+    traço = rng.choice(TRAÇOS)
+    motivo = rng.choice(MOTIVOS)
     return {
         "nome": nome,
         "classe": classe,
@@ -41,30 +50,171 @@ def gerar_personagem():
         "motivo": motivo
     }
 
-def gerar_faccao():
+def gerar_faccao(rng=random):
     return {
-        "nome": random.choice(FACÇÕES),
-        "alinhamento": random.choice(ALINHAMENTOS),
-        "influência": random.randint(1, 100)
+        "nome": rng.choice(FACÇÕES),
+        "alinhamento": rng.choice(ALINHAMENTOS),
+        "influência": rng.randint(1, 100)
     }
 
-def gerar_missao():
+def gerar_missao(rng=random):
     return {
-        "objetivo": random.choice(MISSÕES),
-        "dificuldade": random.choice(["Fácil", "Média", "Difícil", "Épica"]),
-        "recompensa": random.choice(RECOMPENSAS)
+        "objetivo": rng.choice(MISSÕES),
+        "dificuldade": rng.choice(DIFICULDADES),
+        "recompensa": rng.choice(RECOMPENSAS)
     }
 
-def gerar_mapa(tamanho=5):
-    return [[random.choice(BIOMAS) for _ in range(tamanho)] for _ in range(tamanho)]
+def gerar_mapa(tamanho=5, rng=random):
+    return [[rng.choice(BIOMAS) for _ in range(tamanho)] for _ in range(tamanho)]
 
-def rolagem_d20():
-    return random.randint(1, 20)
+def gerar_entidades(n_personagens=0, n_faccoes=0, n_missoes=0, rng=random):
+    """Versão em massa de gerar_personagem/gerar_faccao/gerar_missao.
 
-def salvar_mundo(mundo, arquivo="mundo.json"):
-    with open(arquivo, "w") as f:
+    Gera direto em colunas de códigos (ver entidades.py), sem um dict por entidade,
+    e devolve (personagens, facções, missões) já indexados para consultas."""
+    from entidades import Personagens, Faccoes, Missoes
+
+    def codigos(tabela, n):
+        return rng.choices(range(len(tabela)), k=n)
+
+    personagens = Personagens({"nome": NOMES, "classe": CLASSES, "traço": TRAÇOS, "motivo": MOTIVOS})
+    personagens.estender_codigos({"nome": codigos(NOMES, n_personagens), "classe": codigos(CLASSES, n_personagens),
+                                  "traço": codigos(TRAÇOS, n_personagens), "motivo": codigos(MOTIVOS, n_personagens)})
+    faccoes = Faccoes({"nome": FACÇÕES, "alinhamento": ALINHAMENTOS})
+    faccoes.estender_codigos({"nome": codigos(FACÇÕES, n_faccoes), "alinhamento": codigos(ALINHAMENTOS, n_faccoes),
+                              "influência": rng.choices(range(1, 101), k=n_faccoes)})
+    missoes = Missoes({"objetivo": MISSÕES, "dificuldade": DIFICULDADES, "recompensa": RECOMPENSAS})
+    missoes.estender_codigos({"objetivo": codigos(MISSÕES, n_missoes), "dificuldade": codigos(DIFICULDADES, n_missoes),
+                              "recompensa": codigos(RECOMPENSAS, n_missoes)})
+    return personagens, faccoes, missoes
+
+def gerar_mundo_infinito(semente=0, **opcoes):
+    """Mapa sem bordas em chunks gerados sob demanda (ver mundo_chunks.MundoInfinito).
+
+    mundo.regiao_como_lista(x, y, 5, 5) devolve o mesmo formato de gerar_mapa(5)."""
+    from mundo_chunks import MundoInfinito
+    return MundoInfinito(BIOMAS, semente, **opcoes)
+
+def gerar_mundo(rng=random, tamanho=5, n_personagens=3, n_faccoes=2, n_missoes=3):
+    return {
+        "mapa": gerar_mapa(tamanho, rng),
+        "personagens": [gerar_personagem(rng) for _ in range(n_personagens)],
+        "facções": [gerar_faccao(rng) for _ in range(n_faccoes)],
+        "missões": [gerar_missao(rng) for _ in range(n_missoes)]
+    }
+
+def rolagem_d20(rng=random):
+    return rng.randint(1, 20)
+
+def salvar_mundo(mundo, arquivo="mundo.json", comprimir=False):
+    """Salva em JSON legível ou, se o arquivo terminar em .mundo, no formato binário compacto."""
+    if arquivo.endswith(".mundo"):
+        from mundo_binario import salvar_mundo_binario
+        salvar_mundo_binario(mundo, arquivo, comprimir)
+        return
+    with open(arquivo, "w", encoding="utf-8") as f:
         json.dump(mundo, f, indent=2, ensure_ascii=False)
 
+def carregar_mundo(arquivo="mundo.json"):
+    if arquivo.endswith(".mundo"):
+        from mundo_binario import carregar_mundo_binario
+        return carregar_mundo_binario(arquivo)
+    with open(arquivo, encoding="utf-8") as f:
+        return json.load(f)
+
+# ===============================
+# 🔹 Geração em lote (JSONL ou .mundo, multiprocesso)
+# ===============================
+# Cada mundo i do lote usa rng.seed(semente * 2**32 + i): o resultado é o mesmo
+# independente de quantos processos ou do tamanho dos blocos.
+_rng_worker = random.Random()
+
+def semente_do_mundo(semente, indice):
+    return semente * 2**32 + indice
+
+def _mundos_do_bloco(inicio, fim, semente, config):
+    rng = _rng_worker
+    for i in range(inicio, fim):
+        rng.seed(semente_do_mundo(semente, i))
+        yield {"semente": semente, "índice": i, **gerar_mundo(rng, **config)}
+
+def _gerar_bloco(tarefa):
+    inicio, fim, semente, config, formato, comprimir = tarefa
+    mundos = _mundos_do_bloco(inicio, fim, semente, config)
+    if formato == "binario":
+        # cada bloco é uma sequência de quadros com tabela de strings própria; os blocos
+        # são só concatenados atrás do cabeçalho escrito pelo processo principal
+        from io import BytesIO
+        from mundo_binario import EscritorMundos
+        buf = BytesIO()
+        escritor = EscritorMundos(buf, comprimir, cabecalho=False)
+        for mundo in mundos:
+            escritor.escrever(mundo)
+        return buf.getvalue()
+    linhas = [json.dumps(mundo, ensure_ascii=False, separators=(",", ":")) for mundo in mundos]
+    linhas.append("")
+    return "\n".join(linhas)
+
+def gerar_lote(quantidade, saida, semente=0, processos=None, bloco=1000, formato="jsonl", comprimir=False, **config):
+    """Gera `quantidade` mundos em paralelo e escreve em `saida` (arquivo aberto).
+
+    formato="jsonl" escreve um JSON por linha (arquivo texto); formato="binario" escreve um
+    .mundo (arquivo binário, ver mundo_binario): ~7x menor, mas com os mundos pequenos
+    do padrão não é mais rápido de escrever nem de ler que o JSONL."""
+    if formato == "binario":
+        from mundo_binario import escrever_cabecalho
+        escrever_cabecalho(saida, comprimir)
+    tarefas = ((i, min(i + bloco, quantidade), semente, config, formato, comprimir)
+               for i in range(0, quantidade, bloco))
+    if processos == 1:
+        for tarefa in tarefas:
+            saida.write(_gerar_bloco(tarefa))
+        return
+    processos = processos or os.cpu_count() or 1
+    with Pool(processos) as pool:
+        # janela limitada de blocos em andamento: se a saída for mais lenta que a geração
+        # (ex.: --saida - num pipe), os processos esperam em vez de acumular blocos prontos
+        # na memória. Os blocos são escritos na ordem em que foram enviados.
+        pendentes = deque()
+        for tarefa in tarefas:
+            pendentes.append(pool.apply_async(_gerar_bloco, (tarefa,)))
+            if len(pendentes) >= 2 * processos:
+                saida.write(pendentes.popleft().get())
+        while pendentes:
+            saida.write(pendentes.popleft().get())
+
+def main_lote(args):
+    config = {"tamanho": args.tamanho, "n_personagens": args.personagens,
+              "n_faccoes": args.faccoes, "n_missoes": args.missoes}
+    binario = args.formato == "binario"
+    inicio = time.perf_counter()
+    if args.saida == "-":
+        saida = sys.stdout.buffer if binario else sys.stdout
+        gerar_lote(args.lote, saida, args.semente, args.processos, args.bloco, args.formato, args.comprimir, **config)
+    else:
+        with open(args.saida, "wb") if binario else open(args.saida, "w", encoding="utf-8") as f:
+            gerar_lote(args.lote, f, args.semente, args.processos, args.bloco, args.formato, args.comprimir, **config)
+    duracao = time.perf_counter() - inicio
+    print(f"✅ {args.lote} mundos gerados em {duracao:.2f}s ({args.lote / duracao:,.0f} mundos/s)",
+          file=sys.stderr)
+
+# ===============================
+# 🔹 Mapas grandes (motor_mapa, NumPy)
+# ===============================
+def main_mapa(args):
+    # import tardio: o modo interativo e o lote não dependem de NumPy
+    import motor_mapa
+
+    opcoes = {"coerente": args.ruido == "valor", "escala": args.escala}
+    inicio = time.perf_counter()
+    motor_mapa.gerar_mapa_arquivo(args.mapa_binario, args.tamanho, BIOMAS, args.semente, **opcoes)
+    duracao = time.perf_counter() - inicio
+    print(f"✅ Mapa {args.tamanho}x{args.tamanho} salvo em '{args.mapa_binario}' ({duracao:.2f}s)", file=sys.stderr)
+    if args.exportar_json:
+        mapa, paleta = motor_mapa.carregar_mapa(args.mapa_binario)
+        motor_mapa.exportar_json(args.exportar_json, mapa, paleta)
+        print(f"✅ Mapa exportado em '{args.exportar_json}'", file=sys.stderr)
+
 # ===============================
 # 🔹 Programa principal
 # ===============================
@@ -72,13 +222,7 @@ def main():
     print(Fore.GREEN + "🌍 Gerador Automático de Mundos de RPG")
     print(Fore.YELLOW + "Cria mapas, personagens, facções e missões de forma procedural.\n")
 
-    mundo = {
-        "criado_em": str(datetime.now()),
-        "mapa": gerar_mapa(),
-        "personagens": [gerar_personagem() for _ in range(3)],
-        "facções": [gerar_faccao() for _ in range(2)],
-        "missões": [gerar_missao() for _ in range(3)]
-    }
+    mundo = {"criado_em": str(datetime.now()), **gerar_mundo()}
 
     # mostra mapa
     print(Fore.CYAN + "\n🗺️  Mapa do Mundo:")
@@ -117,6 +261,33 @@ def main():
     print(Fore.GREEN + "\n✅ Mundo salvo em 'mundo.json'.")
 
 # ===============================
+def ler_argumentos(argv=None):
+    parser = argparse.ArgumentParser(description="Gerador Automático de Mundos de RPG")
+    parser.add_argument("--lote", type=int, metavar="N", help="gera N mundos em lote em vez do modo interativo")
+    parser.add_argument("--saida", default="mundos.jsonl", help="arquivo de saída do lote ('-' = stdout)")
+    parser.add_argument("--formato", choices=["jsonl", "binario"], default="jsonl",
+                        help="jsonl = um JSON por linha; binario = formato compacto .mundo")
+    parser.add_argument("--comprimir", action="store_true", help="com --formato binario, comprime os quadros com zlib")
+    parser.add_argument("--semente", type=int, default=0, help="semente do lote (mesma semente = mesmos mundos)")
+    parser.add_argument("--processos", type=int, default=None, help="processos do pool (padrão: núcleos da CPU)")
+    parser.add_argument("--bloco", type=int, default=1000, help="mundos por tarefa enviada a cada processo")
+    parser.add_argument("--mapa-binario", metavar="ARQUIVO",
+                        help="gera só o mapa (--tamanho x --tamanho) no formato binário .mapa (memmap)")
+    parser.add_argument("--ruido", choices=["valor", "celula"], default="valor",
+                        help="valor = terreno coerente (value noise); celula = bioma independente por célula")
+    parser.add_argument("--escala", type=float, default=32.0, help="tamanho médio das regiões de bioma, em células")
+    parser.add_argument("--exportar-json", metavar="ARQUIVO", help="com --mapa-binario, exporta também em JSON")
+    parser.add_argument("--tamanho", type=int, default=5, help="lado do mapa")
+    parser.add_argument("--personagens", type=int, default=3)
+    parser.add_argument("--faccoes", type=int, default=2)
+    parser.add_argument("--missoes", type=int, default=3)
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
-    import time
-    main()
+    args = ler_argumentos()
+    if args.mapa_binario:
+        main_mapa(args)
+    elif args.lote is not None:
+        main_lote(args)
+    else:
+        main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+bench_mundo_binario.py
+Compara o formato binário .mundo com o JSON atual (json.dump indent=2 do salvar_mundo).
+
+Dois cenários:
+  - um mundo grande (mapa --tamanho x --tamanho e milhares de entidades)
+  - um stream de muitos mundos pequenos (o padrão do gerador) contra JSONL compacto
+
+Para cada formato: tamanho em disco, tempo de escrita e de leitura, e a
+verificação de ida e volta (o mundo lido tem que ser igual ao gerado).
+
+Uso:
+  python bench_mundo_binario.py
+  python bench_mundo_binario.py --tamanho 2000 --entidades 50000 --mundos 100000
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import mundo_binario
+
+_spec = importlib.util.spec_from_file_location(
+    "gerador", Path(__file__).with_name("Gerador de joguinhos legais.py"))
+gerador = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(gerador)
+
+
+def cronometrar(funcao):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return time.perf_counter() - inicio, resultado
+
+
+def ler_e_conferir(ler, esperado):
+    """(tempo de leitura, ida e volta ok). O resultado é descartado antes de medir o próximo
+    formato: milhares de dicts ainda vivos deixam o coletor de lixo mais caro para quem vem depois."""
+    tempo, lido = cronometrar(ler)
+    return tempo, lido == esperado
+
+
+def linha(nome, arquivo, escrita, leitura, ok, referencia=None):
+    """Imprime uma linha da tabela; referencia = (bytes, escrita, leitura) do formato JSON."""
+    tamanho = os.path.getsize(arquivo)
+    referencia = referencia or (tamanho, escrita, leitura)
+    print(f"  {nome:<22} {tamanho / 1e6:8.2f} MB {referencia[0] / tamanho:6.1f}x "
+          f"{escrita:8.3f} s {referencia[1] / escrita:5.1f}x {leitura:8.3f} s {referencia[2] / leitura:5.1f}x"
+          f"  {'ok' if ok else 'DIFERENTE'}")
+    return tamanho, escrita, leitura
+
+
+def cabecalho(titulo):
+    print(f"\n{titulo}")
+    print(f"  {'formato':<22} {'tamanho (x menor)':>18} {'escrita (x)':>16} {'leitura (x)':>16}  ida/volta")
+
+
+def bench_mundo_grande(pasta, tamanho, entidades, semente):
+    rng = random.Random(semente)
+    mundo = {"criado_em": "bench", **gerador.gerar_mundo(rng, tamanho, entidades, entidades // 10, entidades // 2)}
+    cabecalho(f"Mundo grande: mapa {tamanho}x{tamanho}, {entidades} personagens")
+
+    arquivo = os.path.join(pasta, "grande.json")
+    escrita, _ = cronometrar(lambda: gerador.salvar_mundo(mundo, arquivo))
+    leitura, ok = ler_e_conferir(lambda: gerador.carregar_mundo(arquivo), mundo)
+    referencia = linha("JSON indent=2 (atual)", arquivo, escrita, leitura, ok)
+
+    for comprimir in (False, True):
+        arquivo = os.path.join(pasta, f"grande{'_z' if comprimir else ''}.mundo")
+        escrita, _ = cronometrar(lambda: gerador.salvar_mundo(mundo, arquivo, comprimir))
+        leitura, ok = ler_e_conferir(lambda: gerador.carregar_mundo(arquivo), mundo)
+        linha(".mundo" + (" + zlib" if comprimir else ""), arquivo, escrita, leitura, ok, referencia)
+
+
+def bench_stream(pasta, quantidade, semente):
+    rng = random.Random(semente)
+    mundos = [{"índice": i, **gerador.gerar_mundo(rng)} for i in range(quantidade)]
+    cabecalho(f"Stream: {quantidade} mundos pequenos")
+
+    arquivo = os.path.join(pasta, "mundos.jsonl")
+
+    def escrever_jsonl():
+        with open(arquivo, "w", encoding="utf-8") as f:
+            for mundo in mundos:
+                f.write(json.dumps(mundo, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def ler_jsonl():
+        with open(arquivo, encoding="utf-8") as f:
+            return [json.loads(l) for l in f]
+
+    escrita, _ = cronometrar(escrever_jsonl)
+    leitura, ok = ler_e_conferir(ler_jsonl, mundos)
+    referencia = linha("JSONL compacto", arquivo, escrita, leitura, ok)
+
+    for comprimir in (False, True):
+        arquivo = os.path.join(pasta, f"mundos{'_z' if comprimir else ''}.mundo")
+
+        def escrever_binario():
+            with mundo_binario.EscritorMundos(arquivo, comprimir) as escritor:
+                for mundo in mundos:
+                    escritor.escrever(mundo)
+
+        escrita, _ = cronometrar(escrever_binario)
+        leitura, ok = ler_e_conferir(lambda: list(mundo_binario.ler_mundos(arquivo)), mundos)
+        linha(".mundo" + (" + zlib" if comprimir else ""), arquivo, escrita, leitura, ok, referencia)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark .mundo vs JSON")
+    parser.add_argument("--tamanho", type=int, default=1000, help="lado do mapa do mundo grande")
+    parser.add_argument("--entidades", type=int, default=10000, help="personagens do mundo grande")
+    parser.add_argument("--mundos", type=int, default=20000, help="mundos pequenos no stream")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        bench_mundo_grande(pasta, args.tamanho, args.entidades, args.semente)
+        bench_stream(pasta, args.mundos, args.semente)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+bench_prog_1.py
+Vazão (MB/s) do contador de palavras do prog_1.py contra o str.split puro.
+
+Gera um corpus sintético (ou usa o arquivo dado) e mede:
+  - str.split: lê o arquivo inteiro como texto e faz len(texto.split()), o jeito original
+  - fluxo: ContadorPalavras em blocos, um processo
+  - paralelo: mmap + pool de processos
+  - top-k: fluxo contando a frequência de cada palavra
+Todos os totais têm que bater com o do str.split.
+
+Uso:
+  python bench_prog_1.py
+  python bench_prog_1.py --mb 1024 --processos 8
+  python bench_prog_1.py --arquivo corpus.txt
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import prog_1
+
+VOCABULARIO = ("o a de que e do da em um para é com não uma os no se na por mais as dos como mas foi "
+               "ao ele das tem à seu sua ou ser quando muito há nos já está eu também só pelo pela até "
+               "isso ela entre era depois sem mesmo aos ter seus quem nas me esse eles estão você tinha "
+               "bixinho raquete mundo facção missão personagem bioma").split()
+
+
+def gerar_corpus(caminho, megabytes, semente=0):
+    """Texto com palavras em distribuição tipo Zipf, linhas de tamanho variado e espaços repetidos.
+
+    Sorteia 64 blocos de ~256 KB e grava o arquivo repetindo-os em ordem aleatória."""
+    rng = random.Random(semente)
+    pesos = [1 / (i + 1) for i in range(len(VOCABULARIO))]
+    blocos = []
+    for _ in range(64):
+        linhas = []
+        for _ in range(4000):
+            palavras = rng.choices(VOCABULARIO, pesos, k=rng.randint(0, 20))
+            linhas.append(rng.choice((" ", " ", " ", "  ", "\t")).join(palavras))
+        blocos.append(("\n".join(linhas) + "\n").encode("utf-8"))
+    alvo = megabytes * 1024 * 1024
+    escrito = 0
+    with open(caminho, "wb") as f:
+        while escrito < alvo:
+            bloco = rng.choice(blocos)
+            f.write(bloco)
+            escrito += len(bloco)
+
+
+def cronometrar(funcao):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return time.perf_counter() - inicio, resultado
+
+
+def com_str_split(caminho):
+    with open(caminho, encoding="utf-8") as f:
+        return len(f.read().split())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do contador de palavras (prog_1.py)")
+    parser.add_argument("--arquivo", help="corpus a usar (padrão: gera um sintético)")
+    parser.add_argument("--mb", type=int, default=256, help="tamanho do corpus sintético")
+    parser.add_argument("--processos", type=int, default=os.cpu_count())
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = args.arquivo
+        if caminho is None:
+            caminho = os.path.join(pasta, "corpus.txt")
+            tempo, _ = cronometrar(lambda: gerar_corpus(caminho, args.mb))
+            print(f"corpus sintético de {args.mb} MB gerado em {tempo:.1f}s")
+        mb = os.path.getsize(caminho) / (1024 * 1024)
+
+        cronometrar(lambda: com_str_split(caminho))  # aquece o cache de disco
+        cenarios = [
+            ("str.split", lambda: com_str_split(caminho)),
+            ("fluxo", lambda: prog_1.contar_arquivo(caminho, processos=1).palavras),
+            (f"paralelo x{args.processos}", lambda: prog_1.contar_arquivo(
+                caminho, processos=args.processos, bloco=prog_1.BLOCO).palavras),
+            (f"top-{args.top}", lambda: prog_1.contar_arquivo(caminho, True, processos=1).palavras),
+        ]
+        # o paralelo só entra acima de MINIMO_PARALELO; aqui mede sempre
+        prog_1.MINIMO_PARALELO = 0
+
+        referencia = None
+        print(f"{mb:,.0f} MB:")
+        for nome, funcao in cenarios:
+            tempo, palavras = cronometrar(funcao)
+            if referencia is None:
+                referencia, base = palavras, tempo
+            confere = "ok" if palavras == referencia else f"DIFERENTE ({palavras:,d} != {referencia:,d})"
+            print(f"  {nome:<14} {tempo:7.2f}s | {mb / tempo:8,.0f} MB/s | {base / tempo:5.1f}x | "
+                  f"{palavras:,d} palavras {confere}")
+
+
+if __name__ == "__main__":
+    main()
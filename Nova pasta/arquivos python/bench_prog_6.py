@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+bench_prog_6.py
+Mede a lista de tarefas do prog_6.py com muitas tarefas (padrão: 1 milhão).
+
+Gera um CSV, importa num banco novo e cronometra o que o usuário sente:
+abrir o banco, a primeira página, uma página lá no fim (cursor), pendentes
+vencendo até uma data, concluir uma tarefa, contar e exportar.
+
+Uso:
+  python bench_prog_6.py
+  python bench_prog_6.py --tarefas 200000
+"""
+
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+
+import prog_6
+
+
+def cronometrar(funcao):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return time.perf_counter() - inicio, resultado
+
+
+def gerar_csv(caminho, n, semente=0):
+    rng = random.Random(semente)
+    hoje = date(2026, 1, 1)
+    with open(caminho, "w", newline="", encoding="utf-8") as f:
+        escritor = csv.writer(f)
+        escritor.writerow(["texto", "status", "prazo"])
+        for i in range(n):
+            prazo = (hoje + timedelta(days=rng.randrange(730))).isoformat() if rng.random() < 0.7 else ""
+            status = prog_6.FEITA if rng.random() < 0.6 else prog_6.PENDENTE
+            escritor.writerow([f"tarefa {i}", status, prazo])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da lista de tarefas em SQLite (prog_6.py)")
+    parser.add_argument("--tarefas", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        origem = os.path.join(pasta, "tarefas.csv")
+        banco = os.path.join(pasta, "tarefas.db")
+        tempo, _ = cronometrar(lambda: gerar_csv(origem, args.tarefas))
+        print(f"CSV com {args.tarefas:,d} tarefas gerado em {tempo:.1f}s")
+
+        with prog_6.Tarefas(banco) as tarefas:
+            tempo, n = cronometrar(lambda: tarefas.importar(origem))
+            print(f"  importar      {tempo:8.2f} s   ({n / tempo:,.0f} tarefas/s)")
+
+        medidas = []
+        tempo, tarefas = cronometrar(lambda: prog_6.Tarefas(banco))
+        medidas.append(("abrir", tempo))
+        medidas.append(("1ª página", cronometrar(lambda: tarefas.listar())[0]))
+        fim = args.tarefas - prog_6.POR_PAGINA
+        medidas.append(("página do fim", cronometrar(lambda: tarefas.listar(depois=fim))[0]))
+        medidas.append(("pendentes", cronometrar(lambda: tarefas.listar(prog_6.PENDENTE, depois=fim // 2))[0]))
+        medidas.append(("vencendo", cronometrar(lambda: tarefas.vencendo("2026-03-01"))[0]))
+        medidas.append(("concluir", cronometrar(lambda: tarefas.concluir(args.tarefas // 2))[0]))
+        for nome, tempo in medidas:
+            print(f"  {nome:<13} {tempo * 1000:8.2f} ms")
+
+        tempo, n = cronometrar(lambda: tarefas.contar(prog_6.PENDENTE))
+        print(f"  contar        {tempo * 1000:8.2f} ms   ({n:,d} pendentes)")
+        tempo, n = cronometrar(lambda: tarefas.exportar(os.path.join(pasta, "saida.jsonl")))
+        print(f"  exportar      {tempo:8.2f} s   ({n / tempo:,.0f} tarefas/s)")
+
+        for sql, parametros in (
+                ("SELECT * FROM tarefas WHERE status = ? AND id > ? ORDER BY id LIMIT 20", ("pendente", 0)),
+                ("SELECT * FROM tarefas WHERE status = ? AND prazo <= ? AND (prazo, id) > (?, ?) "
+                 "ORDER BY prazo, id LIMIT 20", ("pendente", "2026-03-01", "", 0))):
+            plano = tarefas.conexao.execute("EXPLAIN QUERY PLAN " + sql, parametros).fetchall()
+            print("  plano:", "; ".join(linha[-1] for linha in plano))
+        tarefas.fechar()
+
+
+if __name__ == "__main__":
+    main()
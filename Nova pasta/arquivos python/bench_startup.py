@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+bench_startup.py
+Mede o cold start do Chatbot-PYTHON.py até o primeiro prompt "Você>".
+
+O chatbot é executado com stdin fechado: o primeiro input() recebe EOF no
+prompt e o processo sai, então o tempo total do processo é o tempo até o
+prompt (mais o encerramento do interpretador). Com -X importtime listamos
+os imports mais caros para achar quem estourou o orçamento.
+
+Uso:
+  python bench_startup.py              # 10 execuções, orçamento padrão
+  python bench_startup.py -n 30 --budget-ms 120 --top 15
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+CHATBOT = Path(__file__).with_name("Chatbot-PYTHON.py")
+BUDGET_MS = 100  # orçamento de cold start até o primeiro "Você>"
+
+
+def run_once(env) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, str(CHATBOT)], stdin=subprocess.DEVNULL,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def import_costs(env, top: int):
+    """Roda uma vez com -X importtime e retorna os imports com maior tempo cumulativo (µs)."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", str(CHATBOT)], stdin=subprocess.DEVNULL,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=env, text=True)
+    costs = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        costs.append((int(cumulative_us), name[1:].rstrip(), int(self_us)))
+    # só imports de topo (sem indentação extra) dão a visão do que o script puxa diretamente
+    top_level = [c for c in costs if not c[1].startswith("  ")]
+    top_level.sort(reverse=True)
+    return top_level[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de cold start do chatbot")
+    parser.add_argument("-n", type=int, default=10, help="número de execuções")
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS, help="orçamento em ms (mediana)")
+    parser.add_argument("--top", type=int, default=10, help="quantos imports mostrar")
+    parser.add_argument("--with-key", action="store_true",
+                        help="define OPENAI_API_KEY fictícia (openai continua lazy até o primeiro chat)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ, HOME=home, USERPROFILE=home)
+        env.pop("OPENAI_API_KEY", None)
+        if args.with_key:
+            env["OPENAI_API_KEY"] = "sk-bench"
+
+        run_once(env)  # aquece cache de disco / .pyc
+        times = [run_once(env) for _ in range(args.n)]
+        median = statistics.median(times)
+        print(f"Cold start até 'Você>': mediana {median:.1f} ms | "
+              f"min {min(times):.1f} ms | max {max(times):.1f} ms ({args.n} execuções)")
+
+        print("\nImports de topo mais caros (-X importtime, cumulativo):")
+        for cumulative, name, _self in import_costs(env, args.top):
+            print(f"  {cumulative / 1000:8.2f} ms  {name.strip()}")
+
+        if Path(home, ".auto_assistant").exists():
+            print("\nAVISO: o startup criou ~/.auto_assistant antes de qualquer escrita.")
+
+    if median > args.budget_ms:
+        print(f"\nFORA DO ORÇAMENTO: {median:.1f} ms > {args.budget_ms:.0f} ms")
+        sys.exit(1)
+    print(f"\nDentro do orçamento ({args.budget_ms:.0f} ms).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+entidades.py
+Armazém compacto e consultável para personagens, facções e missões em massa.
+
+- Colunas (struct-of-arrays) em array("B"/"H"): cada campo de texto guarda só o
+  código (índice) na tabela original do gerador (CLASSES, TRAÇOS, MOTIVOS, FACÇÕES...)
+- Índices secundários: para cada campo indexado, valor -> array("I") com os ids das
+  linhas em ordem crescente. Consultas começam pela menor lista candidata e só
+  conferem os outros filtros nela, sem varrer a tabela inteira
+- registro(i) devolve o mesmo dict que gerar_personagem/gerar_faccao/gerar_missao
+
+Exemplo:
+  missoes.consultar(dificuldade="Épica", recompensa="magia antiga")
+  faccoes.consultar(alinhamento="Maligno", influência_min=81)
+"""
+
+from array import array
+
+
+class TabelaEntidades:
+    # (campo, tipo): "c" = código numa tabela de textos, "i" = inteiro pequeno (0..65535)
+    CAMPOS = ()
+    INDICES = ()
+
+    def __init__(self, vocabularios):
+        """vocabularios: campo -> lista de textos (as tabelas do gerador) para cada campo "c"."""
+        self.vocabularios = {}
+        self._codigos = {}
+        self.colunas = {}
+        for campo, tipo in self.CAMPOS:
+            if tipo == "c":
+                valores = list(vocabularios[campo])
+                if len(valores) > 256:
+                    raise ValueError(f"{campo}: no máximo 256 valores por tabela")
+                self.vocabularios[campo] = valores
+                self._codigos[campo] = {v: i for i, v in enumerate(valores)}
+                self.colunas[campo] = array("B")
+            else:
+                self.colunas[campo] = array("H")
+        self.indices = {campo: {} for campo in self.INDICES}
+        self._n = 0
+
+    # ---------- inserção ----------
+    def _codigo(self, campo, valor):
+        try:
+            return self._codigos[campo][valor]
+        except KeyError:
+            raise ValueError(f"{campo}: valor desconhecido {valor!r}") from None
+
+    def adicionar(self, registro):
+        """Adiciona um dict no formato dos geradores e retorna o id da linha."""
+        return self.estender({campo: [registro[campo]] for campo, _ in self.CAMPOS})
+
+    def estender(self, colunas):
+        """Adiciona em lote a partir de listas de valores (textos ou inteiros) por campo."""
+        codigos = {}
+        for campo, tipo in self.CAMPOS:
+            valores = colunas[campo]
+            if tipo == "c":
+                mapa = self._codigos[campo]
+                try:
+                    valores = [mapa[v] for v in valores]
+                except KeyError as e:
+                    raise ValueError(f"{campo}: valor desconhecido {e.args[0]!r}") from None
+            codigos[campo] = valores
+        return self.estender_codigos(codigos)
+
+    def estender_codigos(self, codigos):
+        """Caminho rápido: adiciona colunas que já estão em códigos. Retorna o id da primeira linha."""
+        n = len(codigos[self.CAMPOS[0][0]])
+        inicio = self._n
+        # confere todas as colunas antes de estender qualquer uma: um lote recusado
+        # não pode deixar colunas de tamanhos diferentes
+        novas = {}
+        for campo, tipo in self.CAMPOS:
+            valores = codigos[campo]
+            if len(valores) != n:
+                raise ValueError(f"{campo}: {len(valores)} valores, esperado {n}")
+            if tipo == "c":
+                if n and not 0 <= min(valores) <= max(valores) < len(self.vocabularios[campo]):
+                    raise ValueError(f"{campo}: código fora da tabela")
+            elif n and not 0 <= min(valores) <= max(valores) <= 0xFFFF:
+                raise ValueError(f"{campo}: valor fora de 0..65535")
+            novas[campo] = array(self.colunas[campo].typecode, valores)
+        for campo, valores in novas.items():
+            self.colunas[campo].extend(valores)
+        for campo, indice in self.indices.items():
+            for i, v in enumerate(novas[campo], inicio):
+                lista = indice.get(v)
+                if lista is None:
+                    lista = indice[v] = array("I")
+                lista.append(i)
+        self._n += n
+        return inicio
+
+    # ---------- leitura ----------
+    def __len__(self):
+        return self._n
+
+    def valor(self, campo, i):
+        v = self.colunas[campo][i]
+        return self.vocabularios[campo][v] if campo in self.vocabularios else v
+
+    def registro(self, i):
+        if not 0 <= i < self._n:
+            raise IndexError(i)
+        return {campo: self.valor(campo, i) for campo, _ in self.CAMPOS}
+
+    def __iter__(self):
+        for i in range(self._n):
+            yield self.registro(i)
+
+    # ---------- consultas ----------
+    def _filtros(self, filtros):
+        """Traduz os kwargs em predicados (campo, conjunto de valores aceitos | (min, max))."""
+        iguais, faixas = {}, {}
+        tipos = dict(self.CAMPOS)
+        for chave, valor in filtros.items():
+            campo, _, limite = chave.rpartition("_")
+            if limite in ("min", "max") and tipos.get(campo) == "i":
+                mn, mx = faixas.get(campo, (0, 0xFFFF))
+                faixas[campo] = (valor, mx) if limite == "min" else (mn, valor)
+            elif chave in tipos:
+                valores = valor if isinstance(valor, (list, tuple, set, frozenset)) else [valor]
+                if tipos[chave] == "c":
+                    valores = [self._codigo(chave, v) for v in valores]
+                iguais[chave] = frozenset(valores)
+            else:
+                raise TypeError(f"filtro desconhecido: {chave}")
+        return iguais, faixas
+
+    def _candidatos(self, campo, aceitos):
+        indice = self.indices[campo]
+        listas = [indice[v] for v in aceitos if v in indice]
+        return listas, sum(len(l) for l in listas)
+
+    def consultar(self, **filtros):
+        """Ids (array("I"), em ordem) das linhas que satisfazem todos os filtros.
+
+        campo=valor ou campo=[valores] para igualdade; campo_min / campo_max para
+        campos inteiros. Sem nenhum campo indexado nos filtros, cai para uma varredura."""
+        iguais, faixas = self._filtros(filtros)
+        predicados = [(campo, aceitos) for campo, aceitos in iguais.items()]
+        for campo, (mn, mx) in faixas.items():
+            if campo in self.indices:
+                # faixa num campo indexado = união dos valores do índice dentro dela
+                predicados.append((campo, frozenset(v for v in self.indices[campo] if mn <= v <= mx)))
+            else:
+                predicados.append((campo, (mn, mx)))
+
+        # escolhe o predicado indexado mais seletivo como ponto de partida
+        melhor = None
+        for n, (campo, aceitos) in enumerate(predicados):
+            if campo in self.indices and isinstance(aceitos, frozenset):
+                listas, total = self._candidatos(campo, aceitos)
+                if melhor is None or total < melhor[2]:
+                    melhor = (n, listas, total)
+        if melhor is None:
+            ids = range(self._n)
+        else:
+            n, listas, _ = melhor
+            ids = listas[0] if len(listas) == 1 else sorted(i for lista in listas for i in lista)
+            del predicados[n]
+
+        resultado = array("I", ids)
+        for campo, aceitos in predicados:
+            coluna = self.colunas[campo]
+            if isinstance(aceitos, frozenset):
+                resultado = array("I", [i for i in resultado if coluna[i] in aceitos])
+            else:
+                mn, mx = aceitos
+                resultado = array("I", [i for i in resultado if mn <= coluna[i] <= mx])
+        return resultado
+
+    def contar(self, **filtros):
+        return len(self.consultar(**filtros))
+
+    def buscar(self, **filtros):
+        """Como consultar, mas devolve os registros (dicts)."""
+        return [self.registro(i) for i in self.consultar(**filtros)]
+
+    def memoria_em_bytes(self):
+        colunas = sum(c.itemsize * len(c) for c in self.colunas.values())
+        indices = sum(l.itemsize * len(l) for indice in self.indices.values() for l in indice.values())
+        return colunas + indices
+
+
+class Personagens(TabelaEntidades):
+    CAMPOS = (("nome", "c"), ("classe", "c"), ("traço", "c"), ("motivo", "c"))
+    INDICES = ("classe", "traço", "motivo")
+
+
+class Faccoes(TabelaEntidades):
+    CAMPOS = (("nome", "c"), ("alinhamento", "c"), ("influência", "i"))
+    INDICES = ("nome", "alinhamento", "influência")
+
+
+class Missoes(TabelaEntidades):
+    CAMPOS = (("objetivo", "c"), ("dificuldade", "c"), ("recompensa", "c"))
+    INDICES = ("objetivo", "dificuldade", "recompensa")
@@ -0,0 +1,159 @@
+"""
+motor_mapa.py
+Motor de mapas vetorizado para o Gerador de joguinhos legais.
+
+- Biomas guardados como códigos uint8 (índices na paleta BIOMAS), 1 byte por célula
+- Ruído de valor (value noise) em várias oitavas, todo em NumPy: terreno coerente
+  em vez de um random.choice independente por célula
+- O ruído é uma função pura de (semente, x, y): qualquer janela do mundo pode ser
+  gerada sozinha, sem gerar as vizinhas (base do mundo em chunks)
+- Formato binário .mapa (cabeçalho + paleta + tiles crus) que abre com np.memmap;
+  exportar para JSON é só uma opção
+"""
+
+import json
+import struct
+from functools import lru_cache
+
+import numpy as np
+
+MAGIC = b"MAPA"
+VERSAO = 1
+# magic, versão, reservado, largura, altura, bytes da paleta (JSON utf-8)
+_CABECALHO = struct.Struct("<4sHHIII")
+_ALINHAMENTO = 64
+CELULAS_POR_BLOCO = 8_000_000  # ~8 MB de uint8 (e ~32 MB de float32) por bloco de linhas
+
+# ===============================
+# 🔹 Ruído
+# ===============================
+def _hash2d(semente, x, y):
+    """Hash inteiro de 32 bits por célula; x e y são arrays de inteiros (podem ser negativos)."""
+    s = np.uint32((semente * 0x9E3779B1 + (semente >> 32)) & 0xFFFFFFFF)
+    hx = (np.asarray(x, dtype=np.int64) & 0xFFFFFFFF).astype(np.uint32)
+    hy = (np.asarray(y, dtype=np.int64) & 0xFFFFFFFF).astype(np.uint32)
+    h = hx * np.uint32(374761393) + hy * np.uint32(668265263) + s
+    h = (h ^ (h >> np.uint32(13))) * np.uint32(1274126177)
+    return h ^ (h >> np.uint32(16))
+
+def _unitario(h):
+    return (h >> np.uint32(8)).astype(np.float32) * np.float32(1.0 / (1 << 24))
+
+def ruido_celulas(semente, x0, y0, largura, altura):
+    """Um valor em [0, 1) independente por célula (equivalente vetorizado do random.choice por célula)."""
+    xs = np.arange(x0, x0 + largura, dtype=np.int64)
+    ys = np.arange(y0, y0 + altura, dtype=np.int64)
+    return _unitario(_hash2d(semente, xs[None, :], ys[:, None]))
+
+def _eixo(inicio, n, escala):
+    coords = np.arange(inicio, inicio + n, dtype=np.float64) / escala
+    base = np.floor(coords).astype(np.int64)
+    t = (coords - base).astype(np.float32)
+    return base, t * t * (3 - 2 * t)  # smoothstep
+
+def ruido_valor(semente, x0, y0, largura, altura, escala=32.0, oitavas=4, persistencia=0.5):
+    """Value noise fractal em [0, 1) para a janela [x0, x0+largura) × [y0, y0+altura)."""
+    total = np.zeros((altura, largura), dtype=np.float32)
+    amplitude, soma_amplitudes = 1.0, 0.0
+    for oitava in range(oitavas):
+        ix, sx = _eixo(x0, largura, escala)
+        iy, sy = _eixo(y0, altura, escala)
+        # valores só nos pontos da grade grossa que a janela toca...
+        gx = np.arange(ix[0], ix[-1] + 2)
+        gy = np.arange(iy[0], iy[-1] + 2)
+        grade = _unitario(_hash2d(semente + oitava, gx[None, :], gy[:, None]))
+        # ...interpolados primeiro em x (poucas linhas) e depois em y (janela inteira)
+        cx = ix - gx[0]
+        linhas = grade[:, cx] * (1 - sx) + grade[:, cx + 1] * sx
+        cy = iy - gy[0]
+        total += amplitude * (linhas[cy] * (1 - sy)[:, None] + linhas[cy + 1] * sy[:, None])
+        soma_amplitudes += amplitude
+        amplitude *= persistencia
+        escala /= 2
+    total /= soma_amplitudes
+    return total
+
+@lru_cache(maxsize=32)
+def _limiares(n_biomas, escala, oitavas, persistencia):
+    # ruído fractal se concentra perto de 0.5; quantis de uma amostra fixa deixam os
+    # biomas com áreas parecidas. Só dependem dos parâmetros, não da semente nem da janela.
+    amostra = ruido_valor(0x5EED, 0, 0, 512, 512, escala, oitavas, persistencia)
+    return np.quantile(amostra, np.arange(1, n_biomas) / n_biomas).astype(np.float32)
+
+def gerar_biomas(semente, x0, y0, largura, altura, n_biomas, coerente=True,
+                 escala=32.0, oitavas=4, persistencia=0.5):
+    """Códigos de bioma (uint8) de uma janela do mundo infinito definido pela semente."""
+    if not coerente:
+        valores = ruido_celulas(semente, x0, y0, largura, altura)
+        return (valores * n_biomas).astype(np.uint8)
+    valores = ruido_valor(semente, x0, y0, largura, altura, escala, oitavas, persistencia)
+    limiares = _limiares(n_biomas, float(escala), oitavas, persistencia)
+    return np.searchsorted(limiares, valores, side="right").astype(np.uint8)
+
+def _blocos_de_linhas(altura, largura):
+    passo = max(1, CELULAS_POR_BLOCO // max(1, largura))
+    for y in range(0, altura, passo):
+        yield y, min(passo, altura - y)
+
+def gerar_mapa_array(tamanho, n_biomas, semente=0, **opcoes):
+    """Mapa tamanho×tamanho em memória como array uint8 de códigos de bioma."""
+    mapa = np.empty((tamanho, tamanho), dtype=np.uint8)
+    for y, linhas in _blocos_de_linhas(tamanho, tamanho):
+        mapa[y:y + linhas] = gerar_biomas(semente, 0, y, tamanho, linhas, n_biomas, **opcoes)
+    return mapa
+
+# ===============================
+# 🔹 Arquivo .mapa (memmap)
+# ===============================
+def _escrever_cabecalho(f, largura, altura, paleta):
+    paleta_bytes = json.dumps(list(paleta), ensure_ascii=False).encode("utf-8")
+    f.write(_CABECALHO.pack(MAGIC, VERSAO, 0, largura, altura, len(paleta_bytes)))
+    f.write(paleta_bytes)
+    deslocamento = _CABECALHO.size + len(paleta_bytes)
+    preenchimento = -deslocamento % _ALINHAMENTO
+    f.write(b"\0" * preenchimento)
+    return deslocamento + preenchimento
+
+def ler_cabecalho(arquivo):
+    """Retorna (largura, altura, paleta, deslocamento dos tiles)."""
+    with open(arquivo, "rb") as f:
+        magic, versao, _, largura, altura, n_paleta = _CABECALHO.unpack(f.read(_CABECALHO.size))
+        if magic != MAGIC:
+            raise ValueError(f"{arquivo} não é um arquivo .mapa")
+        if versao != VERSAO:
+            raise ValueError(f"versão de .mapa não suportada: {versao}")
+        paleta = json.loads(f.read(n_paleta).decode("utf-8"))
+    deslocamento = _CABECALHO.size + n_paleta
+    return largura, altura, paleta, deslocamento + (-deslocamento % _ALINHAMENTO)
+
+def salvar_mapa(arquivo, mapa, paleta):
+    altura, largura = mapa.shape
+    with open(arquivo, "wb") as f:
+        _escrever_cabecalho(f, largura, altura, paleta)
+        f.write(np.ascontiguousarray(mapa, dtype=np.uint8).tobytes())
+
+def gerar_mapa_arquivo(arquivo, tamanho, paleta, semente=0, **opcoes):
+    """Gera um mapa direto no disco, bloco a bloco: a memória não cresce com o tamanho do mapa."""
+    with open(arquivo, "wb") as f:
+        deslocamento = _escrever_cabecalho(f, tamanho, tamanho, paleta)
+        f.truncate(deslocamento + tamanho * tamanho)
+    mapa = np.memmap(arquivo, dtype=np.uint8, mode="r+", offset=deslocamento, shape=(tamanho, tamanho))
+    for y, linhas in _blocos_de_linhas(tamanho, tamanho):
+        mapa[y:y + linhas] = gerar_biomas(semente, 0, y, tamanho, linhas, len(paleta), **opcoes)
+    mapa.flush()
+    del mapa
+
+def carregar_mapa(arquivo, modo="r"):
+    """Abre um .mapa via memory mapping. Retorna (mapa, paleta); nada é lido até ser acessado."""
+    largura, altura, paleta, deslocamento = ler_cabecalho(arquivo)
+    mapa = np.memmap(arquivo, dtype=np.uint8, mode=modo, offset=deslocamento, shape=(altura, largura))
+    return mapa, paleta
+
+def mapa_como_lista(mapa, paleta):
+    """Converte para o formato antigo: lista de listas com os nomes dos biomas."""
+    nomes = np.asarray(paleta, dtype=object)
+    return nomes[np.asarray(mapa)].tolist()
+
+def exportar_json(arquivo, mapa, paleta):
+    with open(arquivo, "w", encoding="utf-8") as f:
+        json.dump(mapa_como_lista(mapa, paleta), f, ensure_ascii=False)
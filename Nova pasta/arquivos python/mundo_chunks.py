@@ -0,0 +1,121 @@
+"""
+mundo_chunks.py
+Mundo infinito em chunks para o Gerador de joguinhos legais.
+
+- Cada chunk (cx, cy) é tamanho_chunk × tamanho_chunk códigos de bioma (uint8)
+  gerados pelo motor_mapa a partir de (semente, cx, cy) apenas: qualquer região
+  sai sempre igual e sem gerar as vizinhas (e emenda sem costura com elas)
+- Chunks são gerados sob demanda e ficam num cache LRU com limite de memória
+- Opcionalmente os chunks são persistidos num arquivo dbm (chave "cx,cy")
+"""
+
+import dbm
+import json
+from collections import OrderedDict
+
+import numpy as np
+
+import motor_mapa
+
+
+class MundoInfinito:
+    def __init__(self, paleta, semente=0, tamanho_chunk=64, memoria_max_mb=64,
+                 arquivo_chunks=None, coerente=True, escala=32.0):
+        self.paleta = list(paleta)
+        # tipos normalizados: os parâmetros gravados no arquivo de chunks são comparados
+        # como JSON, e escala=32 tem que abrir um arquivo criado com escala=32.0
+        self.semente = int(semente)
+        self.tamanho_chunk = int(tamanho_chunk)
+        self.opcoes = {"coerente": bool(coerente), "escala": float(escala)}
+        self.bytes_por_chunk = tamanho_chunk * tamanho_chunk
+        self.max_chunks = max(1, int(memoria_max_mb * 1024 * 1024) // self.bytes_por_chunk)
+        self._cache = OrderedDict()
+        self.acertos = self.faltas = self.lidos_do_disco = 0
+        self._db = None
+        if arquivo_chunks:
+            self._abrir_db(arquivo_chunks)
+
+    def _abrir_db(self, arquivo):
+        self._db = dbm.open(arquivo, "c")
+        parametros = json.dumps({"paleta": self.paleta, "semente": self.semente,
+                                 "tamanho_chunk": self.tamanho_chunk, **self.opcoes},
+                                ensure_ascii=False).encode("utf-8")
+        salvos = self._db.get(b"__parametros__")
+        if salvos is None:
+            self._db[b"__parametros__"] = parametros
+        elif salvos != parametros:
+            self._db.close()
+            raise ValueError(f"{arquivo} foi gerado com outros parâmetros de mundo")
+
+    # ---------- chunks ----------
+    def _gerar_chunk(self, cx, cy):
+        t = self.tamanho_chunk
+        return motor_mapa.gerar_biomas(self.semente, cx * t, cy * t, t, t, len(self.paleta), **self.opcoes)
+
+    def chunk(self, cx, cy):
+        """Array (somente leitura) de códigos de bioma do chunk (cx, cy)."""
+        chave = (cx, cy)
+        chunk = self._cache.get(chave)
+        if chunk is not None:
+            self._cache.move_to_end(chave)
+            self.acertos += 1
+            return chunk
+        self.faltas += 1
+        if self._db is not None:
+            chave_db = f"{cx},{cy}".encode()
+            dados = self._db.get(chave_db)
+            if dados is not None:
+                chunk = np.frombuffer(dados, dtype=np.uint8).reshape(self.tamanho_chunk, self.tamanho_chunk)
+                self.lidos_do_disco += 1
+            else:
+                chunk = self._gerar_chunk(cx, cy)
+                self._db[chave_db] = chunk.tobytes()
+        else:
+            chunk = self._gerar_chunk(cx, cy)
+        chunk.flags.writeable = False
+        self._cache[chave] = chunk
+        if len(self._cache) > self.max_chunks:
+            self._cache.popitem(last=False)
+        return chunk
+
+    # ---------- consultas ----------
+    def bioma(self, x, y):
+        """Código do bioma na célula global (x, y)."""
+        cx, lx = divmod(x, self.tamanho_chunk)
+        cy, ly = divmod(y, self.tamanho_chunk)
+        return int(self.chunk(cx, cy)[ly, lx])
+
+    def nome_bioma(self, x, y):
+        return self.paleta[self.bioma(x, y)]
+
+    def regiao(self, x0, y0, largura, altura):
+        """Códigos da janela [x0, x0+largura) × [y0, y0+altura), montada só com os chunks que ela toca."""
+        t = self.tamanho_chunk
+        saida = np.empty((altura, largura), dtype=np.uint8)
+        for cy in range(y0 // t, (y0 + altura - 1) // t + 1):
+            ya, yb = max(y0, cy * t), min(y0 + altura, (cy + 1) * t)
+            for cx in range(x0 // t, (x0 + largura - 1) // t + 1):
+                xa, xb = max(x0, cx * t), min(x0 + largura, (cx + 1) * t)
+                saida[ya - y0:yb - y0, xa - x0:xb - x0] = self.chunk(cx, cy)[ya - cy * t:yb - cy * t,
+                                                                            xa - cx * t:xb - cx * t]
+        return saida
+
+    def regiao_como_lista(self, x0, y0, largura, altura):
+        """Mesma região no formato de gerar_mapa (lista de listas de nomes)."""
+        return motor_mapa.mapa_como_lista(self.regiao(x0, y0, largura, altura), self.paleta)
+
+    # ---------- recursos ----------
+    @property
+    def memoria_em_uso(self):
+        return len(self._cache) * self.bytes_por_chunk
+
+    def fechar(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
@@ -1,3 +1,183 @@
-texto = input("Digite uma frase: ")
-palavras = texto.split()
-print("Número de palavras:", len(palavras))
+"""
+prog_1.py
+Contador de palavras: a frase digitada, arquivos ou stdin, de qualquer tamanho.
+
+- Sem argumentos e com terminal: pergunta uma frase, como sempre
+- Arquivos/stdin são lidos em blocos de tamanho fixo, então a memória não cresce
+  com o arquivo; uma palavra cortada no fim de um bloco continua no próximo
+- Arquivos grandes são mapeados com mmap e divididos entre processos, sempre
+  cortando num espaço em branco para nenhuma palavra ficar dividida
+- --top K lista as K palavras mais frequentes
+
+Palavra = sequência de bytes sem espaço em branco ASCII (espaço, \\t, \\n, \\r,
+\\v, \\f), o mesmo critério de bytes.split(). Só conta o total, sem montar a
+lista de palavras: cada bloco vira 'a'/' ' com bytes.translate e as palavras
+são os inícios " a".
+
+Uso:
+  python prog_1.py
+  python prog_1.py livro.txt outro.txt
+  cat corpus.txt | python prog_1.py --top 20
+  python prog_1.py corpus_grande.txt --processos 8 --top 50
+"""
+
+import argparse
+import mmap
+import os
+import re
+import sys
+from collections import Counter
+
+BLOCO = 8 * 1024 * 1024  # bytes lidos por vez
+MINIMO_PARALELO = 64 * 1024 * 1024  # arquivos menores que isso não compensam o pool
+
+_ESPACOS = b" \t\n\r\x0b\x0c"
+_TABELA = bytes(0x20 if i in _ESPACOS else 0x61 for i in range(256))  # espaço -> " ", resto -> "a"
+_ESPACO = re.compile(rb"\s")
+
+
+class ContadorPalavras:
+    """Recebe o texto em blocos de bytes, em ordem, e conta as palavras.
+
+    Com frequencias=True também conta cada palavra (Counter de bytes); aí o pedaço
+    depois do último espaço de um bloco é guardado e colado no começo do próximo."""
+
+    def __init__(self, frequencias=False):
+        self.palavras = 0
+        self.frequencias = Counter() if frequencias else None
+        self._dentro_de_palavra = False
+        self._resto = b""
+
+    def alimentar(self, bloco):
+        if not bloco:
+            return
+        if self.frequencias is not None:
+            self._alimentar_frequencias(bloco)
+            return
+        t = bloco.translate(_TABELA)
+        self.palavras += t.count(b" a")
+        if t[0] == 0x61 and not self._dentro_de_palavra:
+            self.palavras += 1
+        self._dentro_de_palavra = t[-1] == 0x61
+
+    def _alimentar_frequencias(self, bloco):
+        texto = self._resto + bloco
+        corte = max(texto.rfind(c) for c in _ESPACOS) + 1  # 0 se o bloco não tem espaço nenhum
+        palavras = texto[:corte].split()
+        self._resto = texto[corte:]
+        self.palavras += len(palavras)
+        self.frequencias.update(palavras)
+
+    def terminar(self):
+        """Conta a palavra que ficou em aberto no fim do texto. Retorna o total."""
+        if self._resto:
+            self.palavras += 1
+            self.frequencias[self._resto] += 1
+            self._resto = b""
+        return self.palavras
+
+
+def contar_fluxo(arquivo, frequencias=False, bloco=BLOCO):
+    """Conta um arquivo binário aberto (ou sys.stdin.buffer) bloco a bloco."""
+    contador = ContadorPalavras(frequencias)
+    while pedaco := arquivo.read(bloco):
+        contador.alimentar(pedaco)
+    contador.terminar()
+    return contador
+
+
+# ===============================
+# 🔹 Paralelo (mmap + processos)
+# ===============================
+def pontos_de_corte(mapa, partes):
+    """Divide o mapa em até `partes` faixas [inicio, fim) que começam num espaço em branco."""
+    tamanho = len(mapa)
+    cortes = [0]
+    for i in range(1, partes):
+        achou = _ESPACO.search(mapa, max(cortes[-1], tamanho * i // partes))
+        if achou is None:
+            break
+        cortes.append(achou.start())
+    cortes.append(tamanho)
+    return [(a, b) for a, b in zip(cortes, cortes[1:]) if b > a]
+
+
+def _contar_faixa(tarefa):
+    caminho, inicio, fim, frequencias, bloco = tarefa
+    contador = ContadorPalavras(frequencias)
+    with open(caminho, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        for posicao in range(inicio, fim, bloco):
+            contador.alimentar(mapa[posicao:min(posicao + bloco, fim)])
+    contador.terminar()
+    return contador.palavras, contador.frequencias
+
+
+def contar_arquivo(caminho, frequencias=False, processos=None, bloco=BLOCO):
+    """Conta um arquivo; se ele for grande e houver mais de um processo, em paralelo."""
+    processos = processos or os.cpu_count() or 1
+    tamanho = os.path.getsize(caminho)
+    if processos == 1 or tamanho < MINIMO_PARALELO or tamanho == 0:
+        with open(caminho, "rb") as f:
+            return contar_fluxo(f, frequencias, bloco)
+
+    from multiprocessing import Pool
+
+    with open(caminho, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        # mais faixas que processos equilibram melhor a carga
+        faixas = pontos_de_corte(mapa, processos * 4)
+    contador = ContadorPalavras(frequencias)
+    with Pool(processos) as pool:
+        tarefas = [(caminho, a, b, frequencias, bloco) for a, b in faixas]
+        for palavras, contagem in pool.imap_unordered(_contar_faixa, tarefas):
+            contador.palavras += palavras
+            if frequencias:
+                contador.frequencias.update(contagem)
+    return contador
+
+
+# ===============================
+# 🔹 Linha de comando
+# ===============================
+def mostrar_top(frequencias, k):
+    print(f"\n{k} palavras mais frequentes:")
+    for palavra, quantidade in frequencias.most_common(k):
+        print(f"{quantidade:12,d}  {palavra.decode('utf-8', errors='replace')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Conta palavras de uma frase, de arquivos ou do stdin")
+    parser.add_argument("arquivos", nargs="*", help="arquivos de texto (sem nenhum: lê o stdin)")
+    parser.add_argument("--top", type=int, metavar="K", help="mostra as K palavras mais frequentes")
+    parser.add_argument("--processos", type=int, help="processos para arquivos grandes (padrão: núcleos da CPU)")
+    parser.add_argument("--bloco", type=int, default=BLOCO // (1024 * 1024), metavar="MB",
+                        help="tamanho do bloco de leitura em MB")
+    args = parser.parse_args()
+
+    if not args.arquivos and sys.stdin.isatty():
+        texto = input("Digite uma frase: ")
+        palavras = texto.split()
+        print("Número de palavras:", len(palavras))
+        if args.top:
+            mostrar_top(Counter(p.encode() for p in palavras), args.top)
+        return
+
+    frequencias = bool(args.top)
+    bloco = args.bloco * 1024 * 1024
+    total = ContadorPalavras(frequencias)
+    if not args.arquivos:
+        total = contar_fluxo(sys.stdin.buffer, frequencias, bloco)
+    for caminho in args.arquivos:
+        contador = contar_arquivo(caminho, frequencias, args.processos, bloco)
+        if len(args.arquivos) > 1:
+            print(f"{caminho}: {contador.palavras:,d} palavras")
+        total.palavras += contador.palavras
+        if frequencias:
+            total.frequencias.update(contador.frequencias)
+
+    print("Número de palavras:", total.palavras)
+    if args.top:
+        mostrar_top(total.frequencias, args.top)
+
+
+if __name__ == "__main__":
+    main()
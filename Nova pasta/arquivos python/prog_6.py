@@ -1,17 +1,282 @@
-tarefas = []
-
-while True:
-    print("\n1 - Adicionar tarefa")
-    print("2 - Ver tarefas")
-    print("3 - Sair")
-
-    opcao = input("Escolha: ")
-
-    if opcao == "1":
-        tarefa = input("Digite a tarefa: ")
-        tarefas.append(tarefa)
-    elif opcao == "2":
-        for i, t in enumerate(tarefas, 1):
-            print(f"{i}. {t}")
-    elif opcao == "3":
-        break
+"""
+prog_6.py
+Lista de tarefas guardada em SQLite (tarefas.db), não mais numa lista que some ao sair.
+
+- Nada é carregado ao abrir: cada tela busca só a página que vai mostrar
+- Páginas por cursor (id / prazo da última tarefa mostrada), não OFFSET: a
+  página 50.000 custa o mesmo que a primeira
+- Índices em status e em (status, prazo): pendentes e "vencendo até tal dia"
+  saem direto do índice, já ordenados
+- Importação/exportação em massa (CSV ou JSONL, pela extensão) em streaming,
+  numa transação só
+
+Uso:
+  python prog_6.py                       # menu, como antes
+  python prog_6.py --adicionar "pagar conta" --prazo 2026-11-05
+  python prog_6.py --listar --status pendente --por-pagina 50 --depois 1200
+  python prog_6.py --vencendo 2026-12-31
+  python prog_6.py --concluir 42
+  python prog_6.py --importar tarefas.csv
+  python prog_6.py --exportar pendentes.jsonl --status pendente
+"""
+
+import argparse
+import csv
+import json
+import sqlite3
+from datetime import date, datetime
+from itertools import islice
+
+ARQUIVO = "tarefas.db"
+POR_PAGINA = 20
+PENDENTE, FEITA = "pendente", "feita"
+CAMPOS = ("id", "texto", "status", "prazo", "criada")
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS tarefas (
+    id     INTEGER PRIMARY KEY,
+    texto  TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pendente' CHECK (status IN ('pendente', 'feita')),
+    prazo  TEXT,            -- AAAA-MM-DD ou NULL
+    criada TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tarefas_status ON tarefas (status);
+CREATE INDEX IF NOT EXISTS tarefas_status_prazo ON tarefas (status, prazo);
+"""
+
+
+def validar_prazo(prazo):
+    """'' ou None -> None; senão a data em AAAA-MM-DD (ValueError se não for data)."""
+    if prazo is None or prazo == "":
+        return None
+    if not isinstance(prazo, str):
+        raise ValueError(f"prazo inválido: {prazo!r} (use AAAA-MM-DD)")
+    try:
+        return date.fromisoformat(prazo.strip()).isoformat()
+    except ValueError:
+        raise ValueError(f"prazo inválido: {prazo!r} (use AAAA-MM-DD)") from None
+
+
+def validar_status(status):
+    """'' ou None -> PENDENTE; senão tem que ser PENDENTE ou FEITA (ValueError)."""
+    if status is None or status == "":
+        return PENDENTE
+    if not isinstance(status, str) or status not in (PENDENTE, FEITA):
+        raise ValueError(f"status inválido: {status!r} (use {PENDENTE} ou {FEITA})")
+    return status
+
+
+class Tarefas:
+    def __init__(self, arquivo=ARQUIVO):
+        self.conexao = sqlite3.connect(arquivo)
+        self.conexao.execute("PRAGMA journal_mode=WAL")
+        self.conexao.execute("PRAGMA synchronous=NORMAL")
+        self.conexao.executescript(_ESQUEMA)
+
+    def fechar(self):
+        self.conexao.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *erro):
+        self.fechar()
+
+    # ---------- escrita ----------
+    def adicionar(self, texto, prazo=None, status=PENDENTE):
+        with self.conexao:
+            cursor = self.conexao.execute(
+                "INSERT INTO tarefas (texto, status, prazo, criada) VALUES (?, ?, ?, ?)",
+                (texto, validar_status(status), validar_prazo(prazo), datetime.now().isoformat(timespec="seconds")))
+        return cursor.lastrowid
+
+    def concluir(self, id_tarefa):
+        """Marca como feita. Retorna False se a tarefa não existe."""
+        with self.conexao:
+            cursor = self.conexao.execute("UPDATE tarefas SET status = ? WHERE id = ?", (FEITA, id_tarefa))
+        return cursor.rowcount > 0
+
+    # ---------- leitura ----------
+    def contar(self, status=None):
+        if status is None:
+            return self.conexao.execute("SELECT COUNT(*) FROM tarefas").fetchone()[0]
+        return self.conexao.execute("SELECT COUNT(*) FROM tarefas WHERE status = ?", (status,)).fetchone()[0]
+
+    def listar(self, status=None, depois=0, limite=POR_PAGINA):
+        """Uma página em ordem de id: as tarefas com id > depois. Linhas (id, texto, status, prazo, criada)."""
+        if status is None:
+            sql, parametros = "SELECT * FROM tarefas WHERE id > ? ORDER BY id LIMIT ?", (depois, limite)
+        else:
+            sql = "SELECT * FROM tarefas WHERE status = ? AND id > ? ORDER BY id LIMIT ?"
+            parametros = (status, depois, limite)
+        return self.conexao.execute(sql, parametros).fetchall()
+
+    def vencendo(self, ate, depois=("", 0), limite=POR_PAGINA):
+        """Pendentes com prazo até `ate`, por prazo. depois: (prazo, id) da última linha da página anterior."""
+        return self.conexao.execute(
+            "SELECT * FROM tarefas WHERE status = ? AND prazo <= ? AND (prazo, id) > (?, ?) "
+            "ORDER BY prazo, id LIMIT ?",
+            (PENDENTE, validar_prazo(ate), *depois, limite)).fetchall()
+
+    def paginas(self, status=None, limite=POR_PAGINA):
+        """Todas as páginas de listar(), buscadas uma de cada vez."""
+        depois = 0
+        while pagina := self.listar(status, depois, limite):
+            yield pagina
+            depois = pagina[-1][0]
+
+    # ---------- em massa ----------
+    def importar(self, arquivo, lote=10_000):
+        """Importa CSV (cabeçalho com texto e, opcionalmente, status/prazo) ou JSONL. Retorna quantas."""
+        agora = datetime.now().isoformat(timespec="seconds")
+        with open(arquivo, newline="", encoding="utf-8") as f:
+            if arquivo.endswith(".jsonl"):
+                registros = (json.loads(linha) for linha in f if linha.strip())
+            else:
+                registros = csv.DictReader(f)
+            linhas = ((r["texto"], validar_status(r.get("status")), validar_prazo(r.get("prazo")),
+                       r.get("criada") or agora) for r in registros)
+            total = 0
+            with self.conexao:
+                while bloco := list(islice(linhas, lote)):
+                    self.conexao.executemany(
+                        "INSERT INTO tarefas (texto, status, prazo, criada) VALUES (?, ?, ?, ?)", bloco)
+                    total += len(bloco)
+        return total
+
+    def exportar(self, arquivo, status=None):
+        """Exporta em CSV ou JSONL (pela extensão), lendo do banco aos poucos. Retorna quantas."""
+        if status is None:
+            cursor = self.conexao.execute("SELECT * FROM tarefas ORDER BY id")
+        else:
+            cursor = self.conexao.execute("SELECT * FROM tarefas WHERE status = ? ORDER BY id", (status,))
+        total = 0
+        with open(arquivo, "w", newline="", encoding="utf-8") as f:
+            if arquivo.endswith(".jsonl"):
+                while linhas := cursor.fetchmany(10_000):
+                    f.writelines(json.dumps(dict(zip(CAMPOS, linha)), ensure_ascii=False) + "\n"
+                                 for linha in linhas)
+                    total += len(linhas)
+            else:
+                escritor = csv.writer(f)
+                escritor.writerow(CAMPOS)
+                while linhas := cursor.fetchmany(10_000):
+                    escritor.writerows(linhas)
+                    total += len(linhas)
+        return total
+
+
+# ===============================
+# 🔹 Menu e linha de comando
+# ===============================
+def mostrar(linhas):
+    for id_tarefa, texto, status, prazo, _ in linhas:
+        marca = "✔" if status == FEITA else " "
+        print(f"{id_tarefa}. [{marca}] {texto}" + (f"  (até {prazo})" if prazo else ""))
+
+
+def ver_paginado(paginas):
+    """Mostra página por página; Enter mostra a próxima, qualquer outra coisa para."""
+    vazio = True
+    for pagina in paginas:
+        vazio = False
+        mostrar(pagina)
+        if len(pagina) < POR_PAGINA or input("-- Enter para mais, q para voltar: ").strip():
+            break
+    if vazio:
+        print("Nenhuma tarefa.")
+
+
+def paginas_vencendo(tarefas, ate):
+    depois = ("", 0)
+    while pagina := tarefas.vencendo(ate, depois):
+        yield pagina
+        depois = (pagina[-1][3], pagina[-1][0])
+
+
+def menu(tarefas):
+    while True:
+        print("\n1 - Adicionar tarefa")
+        print("2 - Ver tarefas")
+        print("3 - Sair")
+        print("4 - Concluir tarefa")
+        print("5 - Ver pendentes")
+        print("6 - Ver pendentes vencendo até uma data")
+        print("7 - Importar tarefas (CSV/JSONL)")
+        print("8 - Exportar tarefas (CSV/JSONL)")
+
+        opcao = input("Escolha: ")
+
+        try:
+            if opcao == "1":
+                tarefa = input("Digite a tarefa: ")
+                prazo = input("Prazo (AAAA-MM-DD, Enter para nenhum): ")
+                tarefas.adicionar(tarefa, prazo)
+            elif opcao == "2":
+                ver_paginado(tarefas.paginas())
+            elif opcao == "3":
+                break
+            elif opcao == "4":
+                id_tarefa = int(input("Número da tarefa: "))
+                print("Concluída ✅" if tarefas.concluir(id_tarefa) else "Tarefa não encontrada.")
+            elif opcao == "5":
+                ver_paginado(tarefas.paginas(PENDENTE))
+            elif opcao == "6":
+                ver_paginado(paginas_vencendo(tarefas, input("Até (AAAA-MM-DD): ")))
+            elif opcao == "7":
+                print(f"{tarefas.importar(input('Arquivo: '))} tarefas importadas.")
+            elif opcao == "8":
+                print(f"{tarefas.exportar(input('Arquivo: '))} tarefas exportadas.")
+        except (ValueError, KeyError, OSError) as erro:
+            print(f"Erro: {erro}")
+
+
+def executar(tarefas, args):
+    if args.importar:
+        print(f"{tarefas.importar(args.importar)} tarefas importadas.")
+    if args.adicionar:
+        print(f"Tarefa {tarefas.adicionar(args.adicionar, args.prazo)} adicionada.")
+    if args.concluir:
+        print("Concluída ✅" if tarefas.concluir(args.concluir) else "Tarefa não encontrada.")
+    if args.listar:
+        pagina = tarefas.listar(args.status, args.depois, args.por_pagina)
+        mostrar(pagina)
+        if len(pagina) == args.por_pagina:
+            print(f"-- próxima página: --depois {pagina[-1][0]}")
+    if args.vencendo:
+        mostrar(tarefas.vencendo(args.vencendo, limite=args.por_pagina))
+    if args.contar:
+        print(f"{tarefas.contar(args.status)} tarefas")
+    if args.exportar:
+        print(f"{tarefas.exportar(args.exportar, args.status)} tarefas exportadas.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lista de tarefas em SQLite")
+    parser.add_argument("--arquivo", default=ARQUIVO, help="banco SQLite")
+    parser.add_argument("--adicionar", metavar="TEXTO")
+    parser.add_argument("--prazo", help="prazo da tarefa adicionada (AAAA-MM-DD)")
+    parser.add_argument("--concluir", type=int, metavar="ID")
+    parser.add_argument("--listar", action="store_true", help="mostra uma página de tarefas")
+    parser.add_argument("--status", choices=[PENDENTE, FEITA], help="filtra --listar/--exportar/--contar")
+    parser.add_argument("--depois", type=int, default=0, metavar="ID", help="--listar: começa após esse id")
+    parser.add_argument("--por-pagina", type=int, default=POR_PAGINA)
+    parser.add_argument("--vencendo", metavar="DATA", help="pendentes com prazo até DATA (primeira página)")
+    parser.add_argument("--contar", action="store_true")
+    parser.add_argument("--importar", metavar="ARQUIVO", help="CSV ou JSONL")
+    parser.add_argument("--exportar", metavar="ARQUIVO", help="CSV ou JSONL")
+    args = parser.parse_args()
+
+    with Tarefas(args.arquivo) as tarefas:
+        if not (args.adicionar or args.concluir or args.listar or args.vencendo
+                or args.contar or args.importar or args.exportar):
+            menu(tarefas)
+            return
+        try:
+            executar(tarefas, args)
+        except (ValueError, KeyError, OSError) as erro:
+            parser.error(str(erro))
+
+
+if __name__ == "__main__":
+    main()
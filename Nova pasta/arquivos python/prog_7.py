@@ -1,6 +1,243 @@
-texto = input("Escreva algo para salvar no arquivo: ")
+"""
+prog_7.py
+Bloco de notas em bloco.txt: uma nota por linha, só acrescentando no fim.
 
-with open("bloco.txt", "a") as f:
-    f.write(texto + "\n")
+- Sem argumentos e com terminal: pede um texto e salva, como sempre
+- Muitas notas por execução (argumentos ou stdin) são gravadas em lotes: um
+  write + um fsync por lote em vez de abrir, escrever e fechar por nota
+- Índice ao lado (bloco.txt.idx): o offset (uint64) do começo de cada nota, então
+  ler a nota N ou as últimas K é um seek, sem percorrer o arquivo
+- O índice é derivado do bloco.txt: se faltar, estiver atrasado (queda no meio
+  de um lote) ou adiantado, é corrigido ao abrir, sem perder nota nenhuma
 
-print("Texto salvo em bloco.txt ✅")
+Uso:
+  python prog_7.py
+  python prog_7.py "comprar pão" "ligar pro João"
+  seq 100000 | python prog_7.py --stdin
+  python prog_7.py --contar
+  python prog_7.py --ler 42
+  python prog_7.py --cauda 10
+"""
+
+import argparse
+import os
+import struct
+import sys
+
+ARQUIVO = "bloco.txt"
+LOTE = 1024  # notas por gravação (group commit)
+LOTE_BYTES = 1024 * 1024  # ou antes disso, se o lote passar desse tamanho
+
+_OFFSET = struct.Struct("<Q")
+
+
+class BlocoDeNotas:
+    """Log de notas só de acréscimo com índice de offsets.
+
+    Notas numeradas a partir de 0. adicionar() guarda na memória; a cada `lote`
+    notas (ou em confirmar()/fechar()) o lote vai para o disco com fsync.
+    Notas ainda não confirmadas já aparecem em ler() e len()."""
+
+    def __init__(self, arquivo=ARQUIVO, lote=LOTE, sincronizar=True):
+        self.arquivo = arquivo
+        self.arquivo_indice = arquivo + ".idx"
+        self.lote = lote
+        self.sincronizar = sincronizar
+        self._dados = open(arquivo, "a+b")
+        self._indice = open(self.arquivo_indice, "a+b")
+        self._pendentes = []
+        self._bytes_pendentes = 0
+        self._confirmadas = self._recuperar()
+
+    # ---------- índice ----------
+    def _tamanho(self, f):
+        f.flush()
+        return os.fstat(f.fileno()).st_size
+
+    def _offset(self, n):
+        self._indice.seek(n * _OFFSET.size)
+        return _OFFSET.unpack(self._indice.read(_OFFSET.size))[0]
+
+    def _recuperar(self):
+        """Deixa o índice de acordo com o bloco.txt e retorna quantas notas há nele."""
+        tamanho = self._tamanho(self._dados)
+        if tamanho and self._ultimo_byte() != b"\n":
+            # última nota cortada por uma queda no meio do write: fecha a linha
+            self._dados.write(b"\n")
+            self._dados.flush()
+            tamanho += 1
+        entradas = self._tamanho(self._indice) // _OFFSET.size
+        # índice adiantado (bloco.txt truncado ou trocado): descarta o que aponta para fora
+        while entradas and self._offset(entradas - 1) >= tamanho:
+            entradas -= 1
+        if entradas:
+            self._dados.seek(self._offset(entradas - 1))
+            self._dados.readline()
+            coberto = self._dados.tell()
+        else:
+            coberto = 0
+        self._indice.truncate(entradas * _OFFSET.size)
+        if coberto < tamanho:
+            entradas += self._indexar_a_partir_de(coberto)
+        return entradas
+
+    def _ultimo_byte(self):
+        self._dados.seek(-1, os.SEEK_END)
+        return self._dados.read(1)
+
+    def _indexar_a_partir_de(self, posicao, bloco=1024 * 1024):
+        """Acrescenta ao índice as notas de `posicao` até o fim do bloco.txt. Retorna quantas."""
+        self._dados.seek(posicao)
+        offsets = bytearray()
+        inicio_linha = posicao
+        while pedaco := self._dados.read(bloco):
+            i = pedaco.find(b"\n")
+            while i != -1:
+                offsets += _OFFSET.pack(inicio_linha)
+                inicio_linha = posicao + i + 1
+                i = pedaco.find(b"\n", i + 1)
+            posicao += len(pedaco)
+        self._indice.write(offsets)
+        self._indice.flush()
+        return len(offsets) // _OFFSET.size
+
+    def reindexar(self):
+        """Refaz o índice do zero a partir do bloco.txt."""
+        self.confirmar()
+        self._indice.truncate(0)
+        self._confirmadas = self._indexar_a_partir_de(0)
+        return self._confirmadas
+
+    # ---------- escrita ----------
+    def adicionar(self, texto):
+        linha = texto.replace("\r", " ").replace("\n", " ").encode("utf-8") + b"\n"
+        self._pendentes.append(linha)
+        self._bytes_pendentes += len(linha)
+        if len(self._pendentes) >= self.lote or self._bytes_pendentes >= LOTE_BYTES:
+            self.confirmar()
+
+    def confirmar(self):
+        """Grava as notas pendentes: um write e um fsync no bloco.txt, depois o índice.
+
+        O índice não recebe fsync: se ele se perder numa queda, _recuperar() o refaz."""
+        if not self._pendentes:
+            return
+        posicao = self._tamanho(self._dados)
+        offsets = bytearray()
+        for linha in self._pendentes:
+            offsets += _OFFSET.pack(posicao)
+            posicao += len(linha)
+        self._dados.write(b"".join(self._pendentes))
+        self._dados.flush()
+        if self.sincronizar:
+            os.fsync(self._dados.fileno())
+        self._indice.write(offsets)
+        self._indice.flush()
+        self._confirmadas += len(self._pendentes)
+        self._pendentes.clear()
+        self._bytes_pendentes = 0
+
+    # ---------- leitura ----------
+    def __len__(self):
+        return self._confirmadas + len(self._pendentes)
+
+    def ler_faixa(self, inicio, fim):
+        """Notas de inicio até fim (exclusivo), como lista de str."""
+        inicio, fim = max(0, inicio), min(fim, len(self))
+        if inicio >= fim:
+            return []
+        notas = []
+        ate = min(fim, self._confirmadas)
+        if inicio < ate:
+            self._indice.seek(inicio * _OFFSET.size)
+            offsets = self._indice.read((ate - inicio + 1) * _OFFSET.size)  # +1: começo da seguinte
+            a = _OFFSET.unpack_from(offsets, 0)[0]
+            if len(offsets) > (ate - inicio) * _OFFSET.size:
+                b = _OFFSET.unpack_from(offsets, (ate - inicio) * _OFFSET.size)[0]
+            else:
+                b = self._tamanho(self._dados)
+            self._dados.seek(a)
+            # divide os bytes só em b"\n" (o único separador que adicionar() garante);
+            # str.splitlines() também cortaria em \x0c, \x1c, U+2028...
+            notas = [linha.decode("utf-8", errors="replace")
+                     for linha in self._dados.read(b - a).split(b"\n")[:-1]]
+        pendentes = self._pendentes[max(0, inicio - self._confirmadas):fim - self._confirmadas]
+        return notas + [linha[:-1].decode("utf-8") for linha in pendentes]
+
+    def ler(self, n):
+        """Nota n (0 = a primeira; negativos contam do fim)."""
+        if n < 0:
+            n += len(self)
+        if not 0 <= n < len(self):
+            raise IndexError(f"não há nota {n}")
+        return self.ler_faixa(n, n + 1)[0]
+
+    def cauda(self, k):
+        """As últimas k notas."""
+        return self.ler_faixa(len(self) - k, len(self))
+
+    def fechar(self):
+        self.confirmar()
+        self._dados.close()
+        self._indice.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *erro):
+        self.fechar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bloco de notas em arquivo, com leitura por número")
+    parser.add_argument("notas", nargs="*", help="notas a salvar (uma por argumento)")
+    parser.add_argument("--stdin", action="store_true", help="salva cada linha do stdin como uma nota")
+    parser.add_argument("--arquivo", default=ARQUIVO)
+    parser.add_argument("--lote", type=int, default=LOTE, help="notas por gravação em disco")
+    parser.add_argument("--contar", action="store_true", help="mostra quantas notas há")
+    parser.add_argument("--ler", type=int, metavar="N", help="mostra a nota N (1 = a primeira)")
+    parser.add_argument("--cauda", type=int, metavar="K", help="mostra as últimas K notas")
+    parser.add_argument("--reindexar", action="store_true", help="refaz o índice a partir do arquivo")
+    args = parser.parse_args()
+    if args.ler is not None and args.ler < 1:
+        parser.error("--ler: as notas são numeradas a partir de 1")
+    if args.cauda is not None and args.cauda < 0:
+        parser.error("--cauda: K não pode ser negativo")
+
+    leitura = args.contar or args.ler is not None or args.cauda is not None or args.reindexar
+    if not (args.notas or args.stdin or leitura):
+        if not sys.stdin.isatty():
+            args.stdin = True
+        else:
+            texto = input("Escreva algo para salvar no arquivo: ")
+            with BlocoDeNotas(args.arquivo) as bloco:
+                bloco.adicionar(texto)
+            print(f"Texto salvo em {args.arquivo} ✅")
+            return
+
+    with BlocoDeNotas(args.arquivo, args.lote) as bloco:
+        if args.reindexar:
+            print(f"Índice refeito: {bloco.reindexar()} notas")
+        antes = len(bloco)
+        for nota in args.notas:
+            bloco.adicionar(nota)
+        if args.stdin:
+            for linha in sys.stdin:
+                bloco.adicionar(linha.rstrip("\r\n"))
+        if len(bloco) > antes:
+            bloco.confirmar()
+            print(f"{len(bloco) - antes} nota(s) salva(s) em {args.arquivo} ✅")
+        if args.contar:
+            print(f"{len(bloco)} notas")
+        if args.ler is not None:
+            if args.ler > len(bloco):
+                parser.error(f"--ler: não há nota {args.ler} (há {len(bloco)})")
+            print(f"{args.ler}: {bloco.ler(args.ler - 1)}")
+        if args.cauda is not None:
+            primeira = max(1, len(bloco) - args.cauda + 1)
+            for i, nota in enumerate(bloco.cauda(args.cauda), primeira):
+                print(f"{i}. {nota}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+test_entidades.py
+Armazém de entidades em colunas (rodar com: python -m pytest)."""
+
+import random
+
+import pytest
+
+from entidades import Faccoes, Missoes
+
+FACÇÕES = ["Ordem da Luz", "Clã das Sombras", "Guilda dos Mercadores"]
+ALINHAMENTOS = ["Bom", "Neutro", "Maligno"]
+MISSÕES = ["recuperar um artefato perdido", "derrotar uma criatura lendária"]
+DIFICULDADES = ["Fácil", "Média", "Difícil", "Épica"]
+RECOMPENSAS = ["ouro", "magia antiga", "armas raras"]
+
+
+def varrer(tabela, teste):
+    """Ids que uma varredura completa acharia (o resultado esperado das consultas)."""
+    return [i for i, registro in enumerate(tabela) if teste(registro)]
+
+
+def test_missoes_epicas_com_magia_antiga():
+    rng = random.Random(1)
+    missoes = Missoes({"objetivo": MISSÕES, "dificuldade": DIFICULDADES, "recompensa": RECOMPENSAS})
+    for _ in range(2000):
+        missoes.adicionar({"objetivo": rng.choice(MISSÕES), "dificuldade": rng.choice(DIFICULDADES),
+                           "recompensa": rng.choice(RECOMPENSAS)})
+    ids = missoes.consultar(dificuldade="Épica", recompensa="magia antiga")
+    esperado = varrer(missoes, lambda m: m["dificuldade"] == "Épica" and m["recompensa"] == "magia antiga")
+    assert list(ids) == esperado
+    assert esperado
+
+
+def test_faccoes_malignas_com_influencia_acima_de_80():
+    rng = random.Random(2)
+    faccoes = Faccoes({"nome": FACÇÕES, "alinhamento": ALINHAMENTOS})
+    faccoes.estender({"nome": rng.choices(FACÇÕES, k=2000), "alinhamento": rng.choices(ALINHAMENTOS, k=2000),
+                      "influência": rng.choices(range(1, 101), k=2000)})
+    ids = faccoes.consultar(alinhamento="Maligno", influência_min=81)
+    esperado = varrer(faccoes, lambda f: f["alinhamento"] == "Maligno" and f["influência"] > 80)
+    assert list(ids) == esperado
+    assert esperado
+
+
+@pytest.mark.parametrize("codigos", [
+    {"nome": [1, 1], "alinhamento": [1, 1], "influência": [10]},  # tamanho errado
+    {"nome": [1, 1], "alinhamento": [1, 3], "influência": [10, 10]},  # código fora da tabela
+    {"nome": [1, 1], "alinhamento": [1, 1], "influência": [10, 70000]},  # não cabe em u16
+    {"nome": [1, 1], "alinhamento": [1, 1], "influência": [10, -1]},
+])
+def test_lote_recusado_nao_mexe_na_tabela(codigos):
+    faccoes = Faccoes({"nome": FACÇÕES, "alinhamento": ALINHAMENTOS})
+    faccoes.adicionar({"nome": "Ordem da Luz", "alinhamento": "Bom", "influência": 5})
+    with pytest.raises(ValueError):
+        faccoes.estender_codigos(codigos)
+    assert {campo: len(coluna) for campo, coluna in faccoes.colunas.items()} == dict.fromkeys(faccoes.colunas, 1)
+
+    c = {"nome": "Guilda dos Mercadores", "alinhamento": "Neutro", "influência": 42}
+    i = faccoes.adicionar(c)
+    assert faccoes.registro(i) == c
+    assert faccoes.buscar(nome="Guilda dos Mercadores") == [c]
@@ -0,0 +1,75 @@
+"""
+test_mundo_binario.py
+Ida e volta do formato .mundo (rodar com: python -m pytest)."""
+
+import numpy as np
+import pytest
+
+import mundo_binario
+
+
+def mundo_basico(**extras):
+    mundo = {
+        "mapa": [["floresta", "deserto"], ["deserto", "gelo"]],
+        "personagens": [{"nome": "Ana", "classe": "Mago", "traço": "curioso", "motivo": "vingança"}],
+        "facções": [{"nome": "Lobos", "alinhamento": "caótico", "influência": 7}],
+        "missões": [{"objetivo": "achar o mapa", "dificuldade": "fácil", "recompensa": "ouro"}],
+    }
+    mundo.update(extras)
+    return mundo
+
+
+def ida_e_volta(mundos, tmp_path):
+    arquivo = tmp_path / "teste.mundo"
+    with mundo_binario.EscritorMundos(arquivo, comprimir=True) as escritor:
+        for mundo in mundos:
+            escritor.escrever(mundo)
+    return list(mundo_binario.ler_mundos(arquivo))
+
+
+def test_ida_e_volta_com_campos_fora_do_esquema(tmp_path):
+    mundo = mundo_basico(semente=42)
+    mundo["personagens"].append({"nome": "Bia", "classe": "Ladina", "traço": "calma", "motivo": "ouro",
+                                 "nivel": 3, "itens": ["adaga"]})
+    del mundo["missões"]
+    (lido,) = ida_e_volta([mundo], tmp_path)
+    assert lido == mundo
+    assert "missões" not in lido
+
+
+def test_chave_reservada_e_campo_faltando(tmp_path):
+    with pytest.raises(ValueError):
+        ida_e_volta([mundo_basico(**{mundo_binario.CHAVE_EXTRAS: 1})], tmp_path)
+    mundo = mundo_basico()
+    del mundo["facções"][0]["alinhamento"]
+    with pytest.raises(ValueError):
+        ida_e_volta([mundo], tmp_path)
+
+
+def test_stream_com_mais_strings_que_cabem_em_u16(tmp_path):
+    # 8 mundos x 10.000 nomes únicos = 80.000 strings: a tabela tem que recomeçar no meio
+    mundos = [mundo_basico(personagens=[{"nome": f"p{m}-{i}", "classe": "Mago", "traço": "t", "motivo": "m"}
+                                        for i in range(10_000)]) for m in range(8)]
+    assert ida_e_volta(mundos, tmp_path) == mundos
+
+
+def test_mapa_com_mais_de_256_biomas(tmp_path):
+    mapa = [[f"bioma {(y * 20 + x) % 300}" for x in range(20)] for y in range(20)]
+    mundo = mundo_basico(mapa=mapa)
+    assert ida_e_volta([mundo], tmp_path) == [mundo]
+
+    arquivo = tmp_path / "array.mundo"
+    codigos = np.arange(400, dtype=np.uint16).reshape(20, 20) % 300
+    paleta = [f"bioma {i}" for i in range(300)]
+    mundo_binario.salvar_mundo_binario({"mapa": codigos, "paleta": paleta}, arquivo)
+    lido = mundo_binario.carregar_mundo_binario(arquivo, mapa_como_lista=False)
+    assert (lido["mapa"] == codigos).all() and lido["paleta"] == paleta
+
+
+def test_valores_que_nao_cabem_no_formato(tmp_path):
+    with pytest.raises(ValueError):
+        mundo_binario.salvar_mundo_binario({"mapa": np.full((2, 2), 7), "paleta": ["a", "b"]}, tmp_path / "m.mundo")
+    mundo = mundo_basico()
+    mundo["facções"][0]["influência"] = 70_000
+    with pytest.raises(ValueError):
+        ida_e_volta([mundo], tmp_path)
@@ -0,0 +1,33 @@
+"""
+test_prog_6.py
+Validação na importação da lista de tarefas (rodar com: python -m pytest)."""
+
+import json
+
+import pytest
+
+from prog_6 import FEITA, PENDENTE, Tarefas
+
+
+@pytest.mark.parametrize("linha", [
+    {"texto": "x", "prazo": 20261105},
+    {"texto": "x", "prazo": "2026-13-01"},
+    {"texto": "x", "status": 1},
+    {"texto": "x", "status": "talvez"},
+])
+def test_importar_recusa_linha_invalida_sem_gravar_nada(tmp_path, linha):
+    arquivo = tmp_path / "tarefas.jsonl"
+    arquivo.write_text(json.dumps({"texto": "ok"}) + "\n" + json.dumps(linha) + "\n", encoding="utf-8")
+    with Tarefas(str(tmp_path / "tarefas.db")) as tarefas:
+        with pytest.raises(ValueError):
+            tarefas.importar(str(arquivo))
+        assert tarefas.contar() == 0
+
+
+def test_importar_csv_com_status_e_prazo_vazios(tmp_path):
+    arquivo = tmp_path / "tarefas.csv"
+    arquivo.write_text("texto,status,prazo\na,,\nb,feita,2026-11-05\n", encoding="utf-8")
+    with Tarefas(str(tmp_path / "tarefas.db")) as tarefas:
+        assert tarefas.importar(str(arquivo)) == 2
+        assert [(t[1], t[2], t[3]) for t in tarefas.listar()] == [("a", PENDENTE, None),
+                                                                ("b", FEITA, "2026-11-05")]
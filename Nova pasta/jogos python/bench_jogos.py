@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+bench_jogos.py
+Benchmark de tempo por quadro do fuga.py e do raquete.py, sem janela.
+
+Roda N quadros com o driver dummy do SDL, relógio sem limite de FPS e entrada
+roteirizada, medindo separadamente a atualização (regras) e a renderização
+(desenhar + apresentar na tela). No fuga, se o jogador for pego a partida recomeça.
+
+Uso:
+  python bench_jogos.py fuga --quadros 2000
+  python bench_jogos.py fuga --quadros 600 --bixinhos 10000 --continuar
+  python bench_jogos.py raquete --quadros 5000
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from headless import configurar_headless, roteiro_fuga, roteiro_raquete
+
+ORCAMENTO_60FPS_MS = 1000 / 60
+
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(p / 100 * len(ordenados)))]
+
+
+def resumo(nome, tempos_s):
+    ms = [t * 1000 for t in tempos_s]
+    print(f"  {nome:<12} média {statistics.fmean(ms):7.3f} ms | p50 {percentil(ms, 50):7.3f} ms | "
+          f"p99 {percentil(ms, 99):7.3f} ms | máx {max(ms):7.3f} ms")
+
+
+def medir(criar_partida, roteiro, quadros, continuar=False):
+    import pygame
+
+    partida = criar_partida()
+    t_atualizar, t_render = [], []
+    reinicios = 0
+    for quadro in range(quadros):
+        pygame.event.pump()
+        teclas = roteiro(quadro)
+        t0 = time.perf_counter()
+        vivo = partida.atualizar(teclas)
+        t1 = time.perf_counter()
+        partida.desenhar()
+        partida.apresentar()
+        t2 = time.perf_counter()
+        t_atualizar.append(t1 - t0)
+        t_render.append(t2 - t1)
+        if vivo is False and not continuar:
+            partida = criar_partida()
+            reinicios += 1
+    return t_atualizar, t_render, reinicios
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de quadros dos jogos pygame (headless)")
+    parser.add_argument("jogo", choices=["fuga", "raquete"])
+    parser.add_argument("--quadros", type=int, default=2000)
+    parser.add_argument("--bixinhos", type=int, help="fuga: quantidade fixa de bixinhos")
+    parser.add_argument("--continuar", action="store_true",
+                        help="fuga: ignora o game over e segue com o mesmo enxame (teste de carga)")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args()
+
+    configurar_headless()
+    import pygame
+
+    pygame.init()
+    if args.jogo == "fuga":
+        import fuga
+        tela = pygame.display.set_mode((fuga.LARGURA, fuga.ALTURA))
+        rng = random.Random(args.semente)
+        criar = lambda: fuga.JogoFuga(tela, rng, bixinhos=args.bixinhos)
+        roteiro = roteiro_fuga
+    else:
+        import raquete
+        tela = pygame.display.set_mode((raquete.LARGURA, raquete.ALTURA))
+        rng = random.Random(args.semente)
+        criar = lambda: raquete.JogoRaquete(tela, rng)
+        roteiro = roteiro_raquete
+
+    medir(criar, roteiro, min(60, args.quadros), args.continuar)  # aquecimento
+    inicio = time.perf_counter()
+    t_atualizar, t_render, reinicios = medir(criar, roteiro, args.quadros, args.continuar)
+    total = time.perf_counter() - inicio
+    pygame.quit()
+
+    extra = f", {args.bixinhos} bixinhos" if args.bixinhos else ""
+    print(f"{args.jogo}: {args.quadros} quadros{extra} em {total:.2f}s ({args.quadros / total:,.0f} quadros/s)"
+          + (f", {reinicios} reinícios" if reinicios else ""))
+    resumo("atualizar", t_atualizar)
+    resumo("renderizar", t_render)
+    quadro = [a + r for a, r in zip(t_atualizar, t_render)]
+    resumo("quadro", quadro)
+    p99 = percentil(quadro, 99) * 1000
+    print(f"  p99 do quadro {'dentro' if p99 <= ORCAMENTO_60FPS_MS else 'FORA'} do orçamento de 60 FPS "
+          f"({ORCAMENTO_60FPS_MS:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,13 @@
 import pygame
 import random
-import sys
-import time
+import argparse
 
-# Inicializar
-pygame.init()
+from headless import configurar_headless
+from inimigos import Enxame
+from renderizacao import Renderizador
 
 # Tela
 LARGURA, ALTURA = 800, 600
-tela = pygame.display.set_mode((LARGURA, ALTURA))
-pygame.display.set_caption("Fuja do Bixinho 🏃‍♂️")
 
 # Cores
 BRANCO = (255, 255, 255)
@@ -17,84 +15,164 @@ VERMELHO = (255, 0, 0)
 AZUL = (0, 0, 255)
 
 # Jogador
-jogador = pygame.Rect(400, 300, 40, 40)
 vel_jogador = 5
 
 # Fase
-fase = 1
 tempo_fase = [10, 20, 30, 40, 50]  # tempo pra cada fase
-inicio_fase = time.time()
-
-# Bichinhos
-def gerar_bixinhos(n):
-    return [pygame.Rect(random.randint(0, LARGURA-30), random.randint(0, ALTURA-30), 30, 30) for _ in range(n)]
-
-bixinhos = gerar_bixinhos(fase)
-
-def mover_bixinhos(bixinhos, jogador):
-    for bixo in bixinhos:
-        if bixo.x < jogador.x:
-            bixo.x += 2
-        elif bixo.x > jogador.x:
-            bixo.x -= 2
-        if bixo.y < jogador.y:
-            bixo.y += 2
-        elif bixo.y > jogador.y:
-            bixo.y -= 2
-
-def mostrar_texto(texto, tamanho, y):
-    fonte = pygame.font.SysFont(None, tamanho)
-    render = fonte.render(texto, True, (0, 0, 0))
-    tela.blit(render, (20, y))
+QUADROS_POR_SEGUNDO = 60  # o tempo do jogo é contado em quadros, não no relógio
+
+# Bichinhos (posições em arrays, ver inimigos.py)
+TAMANHO_BIXO = 30
+
+def mostrar_texto(render, texto, tamanho, y):
+    # fonte e texto renderizado ficam em cache (renderizacao.py)
+    render.texto(texto, tamanho, (0, 0, 0), (20, y), sistema=True)
+
+class JogoFuga:
+    """Estado e regras do jogo, separados do loop: atualizar() avança um quadro e
+    desenhar() pinta na tela, então dá para rodar sem janela e medir cada parte.
+
+    A partida é determinística: os bixinhos saem de um random.Random(semente) e o
+    tempo das fases conta quadros (QUADROS_POR_SEGUNDO), não o relógio. Mesma
+    semente + mesmas teclas = mesma partida (ver replay_fuga.py).
+    Com tela=None só as regras rodam (replay sem renderização)."""
+
+    def __init__(self, tela, rng=None, bixinhos=None, semente=None):
+        self.tela = tela
+        self.semente = semente if semente is not None else random.randrange(2**32)
+        self.rng = rng if rng is not None else random.Random(self.semente)
+        self.n_bixinhos = bixinhos  # fixa a quantidade de bixinhos (teste de carga); None = um por fase
+        if tela is not None:
+            self.render = Renderizador(tela, BRANCO)
+        self.jogador = pygame.Rect(400, 300, 40, 40)
+        self.quadro = 0
+        self.fase = 1
+        self.inicio_fase = 0
+        self.tempo_passado = 0
+        self.bixinhos = self.gerar_bixinhos(self.fase)
+
+    def gerar_bixinhos(self, n):
+        return Enxame.gerar(self.n_bixinhos or n, LARGURA, ALTURA, self.rng, TAMANHO_BIXO)
+
+    def tempo_limite(self):
+        return tempo_fase[min(self.fase - 1, len(tempo_fase) - 1)]
+
+    def atualizar(self, teclas):
+        """Avança um quadro. Retorna False quando um bixinho pega o jogador."""
+        self.quadro += 1
+        self.tempo_passado = (self.quadro - self.inicio_fase) // QUADROS_POR_SEGUNDO
+
+        # Controles
+        jogador = self.jogador
+        if teclas[pygame.K_LEFT] and jogador.left > 0:
+            jogador.x -= vel_jogador
+        if teclas[pygame.K_RIGHT] and jogador.right < LARGURA:
+            jogador.x += vel_jogador
+        if teclas[pygame.K_UP] and jogador.top > 0:
+            jogador.y -= vel_jogador
+        if teclas[pygame.K_DOWN] and jogador.bottom < ALTURA:
+            jogador.y += vel_jogador
+
+        # Mover bichinhos
+        self.bixinhos.mover(jogador.x, jogador.y)
+
+        # Colisão = Game over (consulta só as células da grade perto do jogador)
+        if self.bixinhos.colide(jogador):
+            return False
+
+        # Próxima fase
+        if self.tempo_passado >= self.tempo_limite():
+            self.fase += 1
+            self.bixinhos = self.gerar_bixinhos(self.fase)
+            self.inicio_fase = self.quadro
+        return True
+
+    # ---------- checkpoints (replay) ----------
+    def estado(self):
+        """Cópia de tudo que atualizar() lê e escreve, para restaurar() depois."""
+        return (tuple(self.jogador), self.quadro, self.fase, self.inicio_fase, self.tempo_passado,
+                self.bixinhos.pos.copy(), self.rng.getstate())
+
+    def restaurar(self, estado):
+        jogador, self.quadro, self.fase, self.inicio_fase, self.tempo_passado, pos, rng = estado
+        self.jogador = pygame.Rect(jogador)
+        self.bixinhos = Enxame(pos.copy(), LARGURA, ALTURA, TAMANHO_BIXO)
+        self.rng.setstate(rng)
+        if self.tela is not None:
+            self.render.invalidar()
+
+    def desenhar(self):
+        render = self.render
+        render.inicio_quadro()
+        mostrar_texto(render, f"Fase {self.fase} - Tempo: {self.tempo_passado}/{self.tempo_limite()}", 36, 10)
+        render.rect(AZUL, self.jogador)
+        # direto do array de posições: com milhares de bixinhos pinta os pixels de uma vez
+        render.quadrados(VERMELHO, self.bixinhos.posicoes_tela(), TAMANHO_BIXO)
+
+    def desenhar_game_over(self):
+        mostrar_texto(self.render, "GAME OVER!", 72, 250)
+
+    def apresentar(self):
+        """Manda para a janela só o que mudou (ou a tela inteira, se mudou demais)."""
+        self.render.apresentar()
 
 # Loop do jogo
-clock = pygame.time.Clock()
-
-while True:
-    clock.tick(60)
-    tela.fill(BRANCO)
-
-    # Tempo
-    tempo_passado = int(time.time() - inicio_fase)
-    mostrar_texto(f"Fase {fase} - Tempo: {tempo_passado}/{tempo_fase[min(fase-1, len(tempo_fase)-1)]}", 36, 10)
-
-    # Controles
-    teclas = pygame.key.get_pressed()
-    if teclas[pygame.K_LEFT] and jogador.left > 0:
-        jogador.x -= vel_jogador
-    if teclas[pygame.K_RIGHT] and jogador.right < LARGURA:
-        jogador.x += vel_jogador
-    if teclas[pygame.K_UP] and jogador.top > 0:
-        jogador.y -= vel_jogador
-    if teclas[pygame.K_DOWN] and jogador.bottom < ALTURA:
-        jogador.y += vel_jogador
-
-    # Mover bichinhos
-    mover_bixinhos(bixinhos, jogador)
-
-    # Desenhar jogador e bichos
-    pygame.draw.rect(tela, AZUL, jogador)
-    for bixo in bixinhos:
-        pygame.draw.rect(tela, VERMELHO, bixo)
-
-        # Colisão = Game over
-        if jogador.colliderect(bixo):
-            mostrar_texto("GAME OVER!", 72, 250)
-            pygame.display.flip()
-            pygame.time.wait(2000)
-            pygame.quit()
-            sys.exit()
-
-    # Próxima fase
-    if tempo_passado >= tempo_fase[min(fase-1, len(tempo_fase)-1)]:
-        fase += 1
-        bixinhos = gerar_bixinhos(fase)
-        inicio_fase = time.time()
-
-    # Eventos
-    for evento in pygame.event.get():
-        if evento.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
-
-    pygame.display.flip()
+def jogo(headless=False, quadros=None, sem_limite=False, bixinhos=None, semente=None, gravar=None, replay=None):
+    if headless:
+        configurar_headless()
+
+    gravacao = gravador = None
+    if replay:
+        from replay_fuga import carregar_gravacao, teclas_do_quadro
+        gravacao = carregar_gravacao(replay)
+        semente, bixinhos = gravacao.semente, gravacao.bixinhos
+        quadros = gravacao.quadros if quadros is None else min(quadros, gravacao.quadros)
+
+    # Inicializar
+    pygame.init()
+    tela = pygame.display.set_mode((LARGURA, ALTURA))
+    pygame.display.set_caption("Fuja do Bixinho 🏃‍♂️")
+
+    partida = JogoFuga(tela, bixinhos=bixinhos, semente=semente)
+    if gravar:
+        from replay_fuga import Gravador
+        gravador = Gravador(partida.semente, bixinhos)
+    clock = pygame.time.Clock()
+    quadro = 0
+
+    while quadros is None or quadro < quadros:
+        clock.tick(0 if sem_limite else QUADROS_POR_SEGUNDO)
+
+        # Eventos
+        if any(evento.type == pygame.QUIT for evento in pygame.event.get()):
+            break
+
+        teclas = teclas_do_quadro(gravacao, quadro) if gravacao else pygame.key.get_pressed()
+        quadro += 1
+        if gravador is not None:
+            gravador.registrar(teclas)
+        vivo = partida.atualizar(teclas)
+        partida.desenhar()
+        if not vivo:
+            partida.desenhar_game_over()
+            partida.apresentar()
+            pygame.time.wait(0 if headless else 2000)
+            break
+
+        partida.apresentar()
+
+    pygame.quit()
+    if gravador is not None:
+        gravador.salvar(gravar, partida)
+        print(f"Gravados {len(gravador)} quadros em {gravar} (semente {partida.semente})")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fuja do Bixinho")
+    parser.add_argument("--headless", action="store_true", help="sem janela nem som (drivers dummy do SDL)")
+    parser.add_argument("--quadros", type=int, help="encerra depois de N quadros")
+    parser.add_argument("--sem-limite", action="store_true", help="não limita a 60 FPS")
+    parser.add_argument("--bixinhos", type=int, help="quantidade fixa de bixinhos em todas as fases")
+    parser.add_argument("--semente", type=int, help="semente dos bixinhos (padrão: aleatória)")
+    parser.add_argument("--gravar", metavar="ARQUIVO", help="grava semente e teclas da partida (ex.: sessao.fuga)")
+    parser.add_argument("--replay", metavar="ARQUIVO", help="assiste uma partida gravada com --gravar")
+    jogo(**vars(parser.parse_args()))
@@ -0,0 +1,42 @@
+"""
+headless.py
+Utilitários para rodar os jogos pygame sem janela: CI, benchmarks e replays.
+
+- configurar_headless(): driver de vídeo/áudio "dummy" do SDL (chamar antes do pygame.init)
+- TeclasScript: substitui pygame.key.get_pressed() por teclas roteirizadas
+- roteiro_fuga / roteiro_raquete: entradas determinísticas quadro a quadro
+"""
+
+import os
+
+import pygame
+
+
+def configurar_headless():
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+
+class TeclasScript:
+    """Imita o retorno de pygame.key.get_pressed(): teclas[pygame.K_x] -> bool."""
+
+    __slots__ = ("pressionadas",)
+
+    def __init__(self, pressionadas=()):
+        self.pressionadas = frozenset(pressionadas)
+
+    def __getitem__(self, tecla):
+        return tecla in self.pressionadas
+
+
+def roteiro_fuga(quadro):
+    """Jogador anda num quadrado (direita, baixo, esquerda, cima), 60 quadros por lado."""
+    lado = (quadro // 60) % 4
+    return TeclasScript([(pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT, pygame.K_UP)[lado]])
+
+
+def roteiro_raquete(quadro):
+    """As duas raquetes sobem e descem, defasadas, 45 quadros em cada sentido."""
+    esquerda = pygame.K_w if (quadro // 45) % 2 else pygame.K_s
+    direita = pygame.K_UP if (quadro // 45 + 1) % 2 else pygame.K_DOWN
+    return TeclasScript([esquerda, direita])
@@ -0,0 +1,154 @@
+"""
+inimigos.py
+Enxame de bixinhos perseguidores para o fuga.py, em arrays NumPy.
+
+- Posições de todos os inimigos num array (N, 2): a perseguição do quadro é
+  uma operação vetorizada, não um loop de Rect em Python
+- Hash espacial em grade uniforme (células do tamanho do bixinho), montado
+  uma vez por quadro: colisão com o jogador só olha as células vizinhas
+- Separação entre inimigos: cada um é empurrado para longe dos vizinhos que se
+  sobrepõem a ele (nas 3×3 células em volta), com força maior que a da perseguição,
+  então o enxame se espalha em vez de virar um bloco. Cada célula vizinha conta como
+  um corpo só, no centro dos seus ocupantes e com o peso de quantos são: exato com
+  um por célula e 9 termos por bixinho mesmo com milhares na tela
+
+Não depende do pygame: desenhar fica por conta do jogo.
+"""
+
+import numpy as np
+
+_ANGULO_DOURADO = np.pi * (3 - np.sqrt(5))
+_VIZINHANCA = np.array([(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1)])
+
+
+class Enxame:
+    def __init__(self, posicoes, largura, altura, tamanho=30, velocidade=2.0, separacao=8.0):
+        self.pos = np.asarray(posicoes, dtype=np.float32).reshape(-1, 2)
+        self.largura, self.altura = largura, altura
+        self.tamanho = tamanho
+        self.velocidade = velocidade
+        self.separacao = separacao
+        self.colunas = largura // tamanho + 1
+        self.linhas = altura // tamanho + 1
+        # direção de desempate para quem está exatamente no centro da célula
+        angulos = np.arange(len(self.pos)) * _ANGULO_DOURADO
+        self._desempate = np.stack([np.cos(angulos), np.sin(angulos)], axis=1).astype(np.float32)
+        self._grade = None
+        # (9, n_celulas): as 3×3 células em volta de cada célula; fora da tela -> n_celulas,
+        # uma célula a mais que fica sempre vazia
+        n_celulas = self.colunas * self.linhas
+        c = np.arange(n_celulas)
+        vx = c % self.colunas + _VIZINHANCA[:, :1]
+        vy = c // self.colunas + _VIZINHANCA[:, 1:]
+        dentro = (vx >= 0) & (vx < self.colunas) & (vy >= 0) & (vy < self.linhas)
+        self._vizinhas = np.where(dentro, vy * self.colunas + vx, n_celulas).astype(np.int32)
+
+    @classmethod
+    def gerar(cls, n, largura, altura, rng, tamanho=30, **opcoes):
+        """n bixinhos em posições aleatórias da tela (rng: random.Random ou o módulo random)."""
+        posicoes = [(rng.randint(0, largura - tamanho), rng.randint(0, altura - tamanho)) for _ in range(n)]
+        return cls(posicoes, largura, altura, tamanho, **opcoes)
+
+    def __len__(self):
+        return len(self.pos)
+
+    # ---------- grade espacial ----------
+    def _celulas(self):
+        c = (self.pos // self.tamanho).astype(np.int64)
+        np.clip(c[:, 0], 0, self.colunas - 1, out=c[:, 0])
+        np.clip(c[:, 1], 0, self.linhas - 1, out=c[:, 1])
+        return c[:, 1] * self.colunas + c[:, 0]
+
+    def atualizar_grade(self):
+        """Reconstrói o hash espacial (ordem por célula + início de cada célula, estilo CSR)."""
+        celulas = self._celulas()
+        ordem = np.argsort(celulas, kind="stable")
+        contagem = np.bincount(celulas, minlength=self.colunas * self.linhas)
+        inicios = np.zeros(len(contagem) + 1, dtype=np.int64)
+        np.cumsum(contagem, out=inicios[1:])
+        self._grade = (celulas, ordem, contagem, inicios)
+
+    def consultar(self, x, y, w, h):
+        """Índices dos bixinhos que sobrepõem o retângulo (x, y, w, h)."""
+        if self._grade is None:
+            self.atualizar_grade()
+        _, ordem, _, inicios = self._grade
+        t = self.tamanho
+        # o canto de um bixinho que encosta no retângulo está em [x - t, x + w) × [y - t, y + h)
+        cx0, cx1 = max(0, int((x - t) // t)), min(self.colunas - 1, int((x + w - 1) // t))
+        cy0, cy1 = max(0, int((y - t) // t)), min(self.linhas - 1, int((y + h - 1) // t))
+        if cx0 > cx1 or cy0 > cy1:
+            return np.empty(0, dtype=np.int64)
+        partes = [ordem[inicios[cy * self.colunas + cx0]:inicios[cy * self.colunas + cx1 + 1]]
+                  for cy in range(cy0, cy1 + 1)]
+        candidatos = np.concatenate(partes)
+        p = self.pos[candidatos]
+        batem = (p[:, 0] < x + w) & (p[:, 0] + t > x) & (p[:, 1] < y + h) & (p[:, 1] + t > y)
+        return candidatos[batem]
+
+    def colide(self, retangulo):
+        """True se algum bixinho encosta no retângulo (aceita pygame.Rect ou (x, y, w, h))."""
+        x, y, w, h = retangulo
+        return len(self.consultar(x, y, w, h)) > 0
+
+    # ---------- movimento ----------
+    def _separacao(self):
+        """Empurrão de cada bixinho para longe dos vizinhos que se sobrepõem a ele.
+
+        Usa as células da grade: cada uma das 3×3 células em volta entra como n bixinhos
+        no centro deles (a do próprio bixinho, sem ele). Quem está a menos de `tamanho`
+        empurra n * separacao * (1 - distância / tamanho); com separacao > velocidade o
+        empurrão vence a perseguição. Custo: 9 termos por bixinho, lotada ou não a célula."""
+        celulas = self._grade[0]
+        t = np.float32(self.tamanho)
+        n_celulas = self.colunas * self.linhas
+        x, y = self.pos[:, 0], self.pos[:, 1]
+        contagem = np.bincount(celulas, minlength=n_celulas + 1).astype(np.float32)
+        soma_x = np.bincount(celulas, x, minlength=n_celulas + 1).astype(np.float32)
+        soma_y = np.bincount(celulas, y, minlength=n_celulas + 1).astype(np.float32)
+        vizinhas = self._vizinhas[:, celulas]  # (9, N): uma linha por célula vizinha
+        n = contagem[vizinhas]
+        centro_x = soma_x[vizinhas]
+        centro_y = soma_y[vizinhas]
+        n[4] -= 1  # linha 4 = a própria célula
+        centro_x[4] -= x
+        centro_y[4] -= y
+        divisor = np.maximum(n, np.float32(1))
+        dx = x - centro_x / divisor
+        dy = y - centro_y / divisor
+        distancia = np.sqrt(dx * dx + dy * dy)
+        forca = n * np.maximum(np.float32(0), np.float32(self.separacao) * (1 - distancia / t))
+        # empurrão na direção d / distância; na mesma posição, na direção de desempate de cada um
+        por_distancia = forca / np.maximum(distancia, np.float32(1e-3))
+        empurrao = np.empty_like(self.pos)
+        empurrao[:, 0] = (por_distancia * dx).sum(axis=0)
+        empurrao[:, 1] = (por_distancia * dy).sum(axis=0)
+        junto = distancia <= np.float32(1e-3)
+        if junto.any():
+            empurrao += (forca * junto).sum(axis=0)[:, None] * self._desempate
+
+        # vários vizinhos somam, mas o passo fica limitado a 2× separacao
+        modulo = np.hypot(empurrao[:, 0], empurrao[:, 1])
+        empurrao *= np.minimum(np.float32(1), np.float32(2 * self.separacao) / np.maximum(modulo, np.float32(1e-6)))[:, None]
+        return empurrao
+
+    def mover(self, alvo_x, alvo_y):
+        """Um quadro: persegue o alvo e separa os amontoados, os dois calculados a partir
+        das posições do começo do quadro (e da grade delas); a grade é montada uma vez, no fim."""
+        if not len(self.pos):
+            return
+        if self._grade is None:
+            self.atualizar_grade()
+        passo = np.array([alvo_x, alvo_y], dtype=np.float32) - self.pos
+        np.clip(passo, -self.velocidade, self.velocidade, out=passo)
+        if self.separacao:
+            passo += self._separacao()
+        self.pos += passo
+
+        np.clip(self.pos[:, 0], 0, self.largura - self.tamanho, out=self.pos[:, 0])
+        np.clip(self.pos[:, 1], 0, self.altura - self.tamanho, out=self.pos[:, 1])
+        self.atualizar_grade()
+
+    def posicoes_tela(self):
+        """Posições inteiras (array (N, 2) de x, y) para desenhar."""
+        return self.pos.astype(np.int32)
@@ -1,120 +1,140 @@
 import pygame
 import random
+import argparse
 
-# Inicializa o Pygame
-pygame.init()
+from headless import configurar_headless
+from renderizacao import Renderizador
+from raquete_fisica import (LARGURA, ALTURA, raquete_LARGURA, raquete_ALTURA, raquete_ESQUERDA_X,
+                            raquete_DIREITA_X, bola_RAIO, bola_VELOCIDADE, PASSO)
+from raquete_regras import ESQUERDA, DIREITA, Partida, passo, criar_ia
 
 # Definindo as cores
 BRANCO = (255, 255, 255)
 PRETO = (0, 0, 0)
 AZUL = (0, 0, 255)
 
-# Tamanho da tela
-LARGURA = 800
-ALTURA = 600
-tela = pygame.display.set_mode((LARGURA, ALTURA))
-pygame.display.set_caption('Jogo de Raquete 2D')
-
-# Raquete
-raquete_LARGURA = 15
-raquete_ALTURA = 100
-raquete_VELOCIDADE = 10
-
-# Bola
-bola_RAIO = 10
-bola_VELOCIDADE = 5
+ATRASO_MAXIMO = 0.25  # s; depois de um travamento não tenta recuperar mais que isso de simulação
 
 # Função para desenhar a raquete
-def desenhar_raquete(x, y):
-    pygame.draw.rect(tela, AZUL, (x, y, raquete_LARGURA, raquete_ALTURA))
+def desenhar_raquete(render, x, y):
+    render.rect(AZUL, (x, round(y), raquete_LARGURA, raquete_ALTURA))
 
 # Função para desenhar a bola
-def desenhar_bola(x, y):
-    pygame.draw.circle(tela, BRANCO, (x, y), bola_RAIO)
+def desenhar_bola(render, x, y):
+    render.circulo(BRANCO, (round(x), round(y)), bola_RAIO)
+
+def interpolar(anterior, atual, alfa):
+    return anterior + (atual - anterior) * alfa
+
+class JogoRaquete:
+    """Liga as regras (raquete_regras.py) ao teclado e à tela: atualizar() avança o tempo
+    e desenhar() pinta, então dá para rodar sem janela e medir cada parte.
+
+    A física roda em passos fixos de PASSO segundos; atualizar() acumula o tempo real
+    do quadro e executa quantos passos couberem. O desenho interpola entre os dois
+    últimos passos, então a bola anda liso em qualquer taxa de atualização da tela.
+    Uma raquete com IA ignora o teclado."""
+
+    def __init__(self, tela, rng=random, velocidade=bola_VELOCIDADE, ia_esquerda=None, ia_direita=None):
+        self.tela = tela
+        self.render = Renderizador(tela, PRETO)
+        self.partida = Partida(rng, velocidade)
+        self.ia_esquerda = ia_esquerda
+        self.ia_direita = ia_direita
+        self.acumulador = 0.0
+        self._guardar_anterior()
+
+    def _guardar_anterior(self):
+        p = self.partida
+        self.anterior = (p.bola.x, p.bola.y, p.esquerda_y, p.direita_y)
+
+    def passo(self, esquerda, direita):
+        """Um passo fixo das regras; esquerda/direita: -1 sobe, 0 parada, 1 desce."""
+        self._guardar_anterior()
+        if self.ia_esquerda:
+            esquerda = self.ia_esquerda.decidir(self.partida, ESQUERDA)
+        if self.ia_direita:
+            direita = self.ia_direita.decidir(self.partida, DIREITA)
+        if passo(self.partida, esquerda, direita) is not None:
+            self._guardar_anterior()  # saque não é interpolado a partir do gol
+
+    def atualizar(self, teclas, dt=1 / 60):
+        """Avança dt segundos de jogo (por padrão um quadro a 60 FPS)."""
+        # Controle das raquetes
+        esquerda = teclas[pygame.K_s] - teclas[pygame.K_w]
+        direita = teclas[pygame.K_DOWN] - teclas[pygame.K_UP]
+
+        self.acumulador += min(dt, ATRASO_MAXIMO)
+        while self.acumulador >= PASSO:
+            self.passo(esquerda, direita)
+            self.acumulador -= PASSO
+
+    def desenhar(self):
+        render = self.render
+        p = self.partida
+        # Apagar só o que foi desenhado no quadro anterior
+        render.inicio_quadro()
+
+        # Desenhar os objetos na tela, interpolados entre os dois últimos passos de física
+        alfa = self.acumulador / PASSO
+        bola_x, bola_y, esquerda_y, direita_y = self.anterior
+        desenhar_raquete(render, raquete_ESQUERDA_X, interpolar(esquerda_y, p.esquerda_y, alfa))
+        desenhar_raquete(render, raquete_DIREITA_X, interpolar(direita_y, p.direita_y, alfa))
+        desenhar_bola(render, interpolar(bola_x, p.bola.x, alfa), interpolar(bola_y, p.bola.y, alfa))
+
+        # Mostrar a pontuação (texto renderizado fica em cache até o placar mudar)
+        render.texto(f"{p.pontos_esquerda} - {p.pontos_direita}", 36, BRANCO, (0, 20), centro_x=LARGURA // 2)
+
+    def apresentar(self):
+        """Manda para a janela só os retângulos que mudaram."""
+        self.render.apresentar()
 
 # Função principal
-def jogo():
-    # Posições iniciais das raquetes e bola
-    raquete_esquerda_y = (ALTURA - raquete_ALTURA) // 2
-    raquete_direita_y = (ALTURA - raquete_ALTURA) // 2
-    bola_x = LARGURA // 2
-    bola_y = ALTURA // 2
+def jogo(headless=False, quadros=None, sem_limite=False, fps=60, velocidade=bola_VELOCIDADE,
+         ia_esquerda=None, ia_direita=None):
+    if headless:
+        configurar_headless()
 
-    bola_dx = random.choice([bola_VELOCIDADE, -bola_VELOCIDADE])  # Direção horizontal
-    bola_dy = random.choice([bola_VELOCIDADE, -bola_VELOCIDADE])  # Direção vertical
+    # Inicializa o Pygame
+    pygame.init()
+    tela = pygame.display.set_mode((LARGURA, ALTURA))
+    pygame.display.set_caption('Jogo de Raquete 2D')
 
-    # Pontuação
-    pontos_esquerda = 0
-    pontos_direita = 0
+    partida = JogoRaquete(tela, velocidade=velocidade,
+                          ia_esquerda=criar_ia(ia_esquerda) if ia_esquerda else None,
+                          ia_direita=criar_ia(ia_direita) if ia_direita else None)
 
     # Controle do jogo
     clock = pygame.time.Clock()
     rodando = True
-    while rodando:
+    quadro = 0
+    dt = 0.0
+    while rodando and (quadros is None or quadro < quadros):
+        quadro += 1
         for evento in pygame.event.get():
             if evento.type == pygame.QUIT:
                 rodando = False
 
-        # Controle das raquetes
-        teclas = pygame.key.get_pressed()
-        if teclas[pygame.K_w] and raquete_esquerda_y > 0:
-            raquete_esquerda_y -= raquete_VELOCIDADE
-        if teclas[pygame.K_s] and raquete_esquerda_y < ALTURA - raquete_ALTURA:
-            raquete_esquerda_y += raquete_VELOCIDADE
-        if teclas[pygame.K_UP] and raquete_direita_y > 0:
-            raquete_direita_y -= raquete_VELOCIDADE
-        if teclas[pygame.K_DOWN] and raquete_direita_y < ALTURA - raquete_ALTURA:
-            raquete_direita_y += raquete_VELOCIDADE
-
-        # Movimento da bola
-        bola_x += bola_dx
-        bola_y += bola_dy
-
-        # Colisão da bola com a parte superior e inferior da tela
-        if bola_y - bola_RAIO <= 0 or bola_y + bola_RAIO >= ALTURA:
-            bola_dy = -bola_dy  # Inverte a direção vertical
-
-        # Colisão da bola com as raquetes
-        if bola_x - bola_RAIO <= raquete_LARGURA and raquete_esquerda_y < bola_y < raquete_esquerda_y + raquete_ALTURA:
-            bola_dx = -bola_dx
-        if bola_x + bola_RAIO >= LARGURA - raquete_LARGURA and raquete_direita_y < bola_y < raquete_direita_y + raquete_ALTURA:
-            bola_dx = -bola_dx
-
-        # Se a bola passar pela raquete (gol)
-        if bola_x - bola_RAIO <= 0:
-            pontos_direita += 1
-            bola_x = LARGURA // 2
-            bola_y = ALTURA // 2
-            bola_dx = random.choice([bola_VELOCIDADE, -bola_VELOCIDADE])
-            bola_dy = random.choice([bola_VELOCIDADE, -bola_VELOCIDADE])
-
-        if bola_x + bola_RAIO >= LARGURA:
-            pontos_esquerda += 1
-            bola_x = LARGURA // 2
-            bola_y = ALTURA // 2
-            bola_dx = random.choice([bola_VELOCIDADE, -bola_VELOCIDADE])
-            bola_dy = random.choice([bola_VELOCIDADE, -bola_VELOCIDADE])
-
-        # Preencher o fundo da tela
-        tela.fill(PRETO)
-
-        # Desenhar os objetos na tela
-        desenhar_raquete(30, raquete_esquerda_y)
-        desenhar_raquete(LARGURA - 30 - raquete_LARGURA, raquete_direita_y)
-        desenhar_bola(bola_x, bola_y)
-
-        # Mostrar a pontuação
-        fonte = pygame.font.Font(None, 36)
-        texto = fonte.render(f"{pontos_esquerda} - {pontos_direita}", True, BRANCO)
-        tela.blit(texto, (LARGURA // 2 - texto.get_width() // 2, 20))
+        # A física anda pelo tempo real do quadro, não pelo número de quadros
+        partida.atualizar(pygame.key.get_pressed(), dt)
+        partida.desenhar()
 
         # Atualizar a tela
-        pygame.display.flip()
+        partida.apresentar()
 
         # Controlar a taxa de quadros
-        clock.tick(60)
+        dt = clock.tick(0 if sem_limite else fps) / 1000
 
     pygame.quit()
 
 # Iniciar o jogo
-jogo()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Jogo de Raquete 2D")
+    parser.add_argument("--headless", action="store_true", help="sem janela nem som (drivers dummy do SDL)")
+    parser.add_argument("--quadros", type=int, help="encerra depois de N quadros")
+    parser.add_argument("--sem-limite", action="store_true", help="não limita os FPS")
+    parser.add_argument("--fps", type=int, default=60, help="limite de quadros por segundo")
+    parser.add_argument("--velocidade", type=float, default=bola_VELOCIDADE, help="velocidade da bola em px/s por eixo")
+    parser.add_argument("--ia-esquerda", metavar="IA", help="IA na raquete esquerda: seguidora, preditiva ou preditiva:ERRO")
+    parser.add_argument("--ia-direita", metavar="IA", help="IA na raquete direita (mesmas opções)")
+    jogo(**vars(parser.parse_args()))
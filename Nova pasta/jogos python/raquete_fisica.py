@@ -0,0 +1,103 @@
+"""
+raquete_fisica.py
+Física do jogo de raquete, sem pygame.
+
+- Tudo em pixels por segundo, avançado em passos fixos de PASSO segundos: a
+  velocidade do jogo não depende mais da taxa de quadros
+- Colisão contínua (swept): em cada passo a bola calcula o instante exato em que
+  encosta em parede, face de raquete ou linha de gol e resolve os eventos em
+  ordem, então mesmo uma bola muito rápida não atravessa a raquete
+"""
+
+# Tamanho da tela
+LARGURA = 800
+ALTURA = 600
+
+# Raquete (x da borda esquerda de cada raquete, como desenhadas na tela)
+raquete_LARGURA = 15
+raquete_ALTURA = 100
+raquete_MARGEM = 30
+raquete_ESQUERDA_X = raquete_MARGEM
+raquete_DIREITA_X = LARGURA - raquete_MARGEM - raquete_LARGURA
+raquete_VELOCIDADE = 600.0  # px/s (eram 10 px por quadro a 60 FPS)
+
+# Bola
+bola_RAIO = 10
+bola_VELOCIDADE = 300.0  # px/s em cada eixo (eram 5 px por quadro a 60 FPS)
+
+PASSO = 1 / 120  # segundos de simulação por passo fixo
+MAX_EVENTOS_POR_PASSO = 32
+
+# faces por onde a bola pode bater; o centro da bola encosta a um raio de distância
+_FACE_ESQUERDA = raquete_ESQUERDA_X + raquete_LARGURA + bola_RAIO
+_FACE_DIREITA = raquete_DIREITA_X - bola_RAIO
+
+GOL_ESQUERDA = "esquerda"  # a bola saiu pela esquerda: ponto do jogador da direita
+GOL_DIREITA = "direita"
+
+
+class Bola:
+    __slots__ = ("x", "y", "vx", "vy")
+
+    def __init__(self, x, y, vx, vy):
+        self.x, self.y, self.vx, self.vy = x, y, vx, vy
+
+
+def mover_raquete(y, direcao, dt):
+    """direcao: -1 (sobe), 0 ou 1 (desce). Retorna o novo y, preso à tela."""
+    y += direcao * raquete_VELOCIDADE * dt
+    return min(max(y, 0.0), ALTURA - raquete_ALTURA)
+
+
+def _na_raquete(y_bola, y_raquete):
+    return y_raquete <= y_bola <= y_raquete + raquete_ALTURA
+
+
+def passo_bola(bola, esquerda_y, direita_y, dt):
+    """Avança a bola dt segundos com colisão contínua.
+
+    Retorna GOL_ESQUERDA / GOL_DIREITA se a bola chegou à linha de gol (a bola fica
+    parada ali; quem chama decide o saque), ou None."""
+    restante = dt
+    for _ in range(MAX_EVENTOS_POR_PASSO):
+        x, y, vx, vy = bola.x, bola.y, bola.vx, bola.vy
+        # (instante do evento, tipo), procurando o primeiro dentro do tempo restante
+        evento_t, evento = restante, None
+        if vy < 0:
+            t = (y - bola_RAIO) / -vy
+            if t < evento_t:
+                evento_t, evento = t, "teto"
+        elif vy > 0:
+            t = (ALTURA - bola_RAIO - y) / vy
+            if t < evento_t:
+                evento_t, evento = t, "chao"
+        if vx < 0:
+            if x >= _FACE_ESQUERDA:
+                t = (x - _FACE_ESQUERDA) / -vx
+                if t < evento_t and _na_raquete(y + vy * t, esquerda_y):
+                    evento_t, evento = t, "raquete"
+            t = (x - bola_RAIO) / -vx
+            if t < evento_t:
+                evento_t, evento = t, GOL_ESQUERDA
+        elif vx > 0:
+            if x <= _FACE_DIREITA:
+                t = (_FACE_DIREITA - x) / vx
+                if t < evento_t and _na_raquete(y + vy * t, direita_y):
+                    evento_t, evento = t, "raquete"
+            t = (LARGURA - bola_RAIO - x) / vx
+            if t < evento_t:
+                evento_t, evento = t, GOL_DIREITA
+
+        evento_t = max(evento_t, 0.0)
+        bola.x = x + vx * evento_t
+        bola.y = y + vy * evento_t
+        restante -= evento_t
+        if evento is None:
+            return None
+        if evento in (GOL_ESQUERDA, GOL_DIREITA):
+            return evento
+        if evento == "raquete":
+            bola.vx = -vx
+        else:
+            bola.vy = -vy
+    return None
@@ -0,0 +1,138 @@
+"""
+raquete_regras.py
+Regras do jogo de raquete sem pygame e sem renderização: estado da partida,
+passo(), saque e placar, mais raquetes controladas por IA.
+
+Uma partida avança só por passo(partida, esquerda, direita), com entradas
+-1/0/1 para cada raquete. O mesmo código roda a janela do raquete.py, o
+torneio headless (torneio_raquete.py) e qualquer teste.
+"""
+
+import random
+
+from raquete_fisica import (LARGURA, ALTURA, raquete_ALTURA, raquete_ESQUERDA_X, raquete_DIREITA_X,
+                            raquete_LARGURA, bola_RAIO, bola_VELOCIDADE, PASSO, GOL_ESQUERDA,
+                            Bola, mover_raquete, passo_bola)
+
+ESQUERDA, DIREITA = "esquerda", "direita"
+
+
+class Partida:
+    __slots__ = ("rng", "velocidade", "bola", "esquerda_y", "direita_y",
+                 "pontos_esquerda", "pontos_direita", "passos")
+
+    def __init__(self, rng=None, velocidade=bola_VELOCIDADE):
+        self.rng = rng if rng is not None else random.Random()
+        self.velocidade = velocidade
+        self.esquerda_y = self.direita_y = float((ALTURA - raquete_ALTURA) // 2)
+        self.bola = Bola(0.0, 0.0, 0.0, 0.0)
+        self.pontos_esquerda = self.pontos_direita = 0
+        self.passos = 0
+        sacar(self)
+
+
+def sacar(partida):
+    bola, v = partida.bola, partida.velocidade
+    bola.x = float(LARGURA // 2)
+    bola.y = float(ALTURA // 2)
+    bola.vx = partida.rng.choice([v, -v])  # Direção horizontal
+    bola.vy = partida.rng.choice([v, -v])  # Direção vertical
+
+
+def passo(partida, esquerda, direita, dt=PASSO):
+    """Avança um passo fixo. esquerda/direita: -1 sobe, 0 parada, 1 desce.
+
+    Retorna o lado que marcou o ponto (ESQUERDA/DIREITA) ou None."""
+    partida.passos += 1
+    partida.esquerda_y = mover_raquete(partida.esquerda_y, esquerda, dt)
+    partida.direita_y = mover_raquete(partida.direita_y, direita, dt)
+    gol = passo_bola(partida.bola, partida.esquerda_y, partida.direita_y, dt)
+    if gol is None:
+        return None
+    # Se a bola passar pela raquete (gol)
+    if gol == GOL_ESQUERDA:
+        partida.pontos_direita += 1
+        marcou = DIREITA
+    else:
+        partida.pontos_esquerda += 1
+        marcou = ESQUERDA
+    sacar(partida)
+    return marcou
+
+
+# ===============================
+# 🔹 IA
+# ===============================
+class IASeguidora:
+    """Segue a altura da bola, com uma zona morta para não tremer."""
+
+    def __init__(self, zona_morta=8.0):
+        self.zona_morta = zona_morta
+
+    def alvo(self, partida, lado):
+        return partida.bola.y
+
+    def decidir(self, partida, lado):
+        centro = (partida.esquerda_y if lado == ESQUERDA else partida.direita_y) + raquete_ALTURA / 2
+        diferenca = self.alvo(partida, lado) - centro
+        if diferenca > self.zona_morta:
+            return 1
+        if diferenca < -self.zona_morta:
+            return -1
+        return 0
+
+
+class IAPreditiva(IASeguidora):
+    """Prevê onde a bola vai cruzar a sua face (rebatendo no teto e no chão) e vai para lá.
+
+    erro: desvio (px) sorteado a cada saque/rebatida, o que regula a dificuldade.
+    Quando a bola está indo embora, volta para o centro."""
+
+    def __init__(self, erro=0.0, zona_morta=4.0, rng=None):
+        super().__init__(zona_morta)
+        self.erro = erro
+        self.rng = rng if rng is not None else random.Random()
+        self._lance = None  # (sentido da bola, pontos já marcados) do desvio atual
+        self._desvio = 0.0
+
+    def alvo(self, partida, lado):
+        bola = partida.bola
+        indo = bola.vx < 0 if lado == ESQUERDA else bola.vx > 0
+        if not indo:
+            self._lance = None
+            return ALTURA / 2
+        # um novo lance começa a cada rebatida (vx muda) e a cada saque (o placar muda),
+        # mesmo que o saque venha para o mesmo lado da bola anterior
+        lance = (bola.vx, partida.pontos_esquerda + partida.pontos_direita)
+        if self._lance != lance:
+            self._lance = lance
+            self._desvio = self.rng.gauss(0.0, self.erro) if self.erro else 0.0
+        face = raquete_ESQUERDA_X + raquete_LARGURA + bola_RAIO if lado == ESQUERDA else raquete_DIREITA_X - bola_RAIO
+        t = (face - bola.x) / bola.vx
+        # "desdobra" as rebatidas verticais: reflete a posição num intervalo de altura útil
+        util = ALTURA - 2 * bola_RAIO
+        y = (bola.y - bola_RAIO + bola.vy * t) % (2 * util)
+        if y > util:
+            y = 2 * util - y
+        return y + bola_RAIO + self._desvio
+
+
+def criar_ia(especificacao, rng=None):
+    """'seguidora', 'preditiva' ou 'preditiva:ERRO' (ex.: 'preditiva:40')."""
+    nome, _, parametro = especificacao.partition(":")
+    if nome == "seguidora":
+        return IASeguidora(float(parametro) if parametro else 8.0)
+    if nome == "preditiva":
+        return IAPreditiva(float(parametro) if parametro else 0.0, rng=rng)
+    raise ValueError(f"IA desconhecida: {especificacao}")
+
+
+def jogar_partida(ia_esquerda, ia_direita, rng, pontos_para_vencer=5, max_passos=120 * 60 * 10,
+                  velocidade=bola_VELOCIDADE):
+    """Partida completa entre duas IAs, sem tela. Retorna a Partida no estado final."""
+    partida = Partida(rng, velocidade)
+    while partida.passos < max_passos:
+        marcou = passo(partida, ia_esquerda.decidir(partida, ESQUERDA), ia_direita.decidir(partida, DIREITA))
+        if marcou and max(partida.pontos_esquerda, partida.pontos_direita) >= pontos_para_vencer:
+            break
+    return partida
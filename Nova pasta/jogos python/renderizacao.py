@@ -0,0 +1,159 @@
+"""
+renderizacao.py
+Camada de desenho compartilhada pelo fuga.py e pelo raquete.py.
+
+- Renderizador.fonte(): fontes em cache (SysFont varre as fontes do sistema a cada chamada)
+- Renderizador.texto(): superfícies de texto renderizadas em cache por (texto, tamanho,
+  cor); placar e cronômetro só mudam de vez em quando. Os caches são do Renderizador,
+  não do módulo: fontes do pygame não sobrevivem a um pygame.quit(), e cada jogo()
+  cria um Renderizador novo depois do pygame.init()
+- Renderizador: retângulos sujos. Cada quadro apaga só onde houve desenho no quadro
+  anterior, desenha de novo e manda pygame.display.update(rects) com a união dos
+  dois conjuntos, em vez de fill + flip da tela inteira. Se um quadro tiver
+  retângulos demais (ex.: milhares de bixinhos), volta para fill + flip
+- Renderizador.quadrados(): muitos quadrados de uma cor a partir de um array NumPy
+  (N, 2), sem lista de tuplas em Python. Com milhares, monta a cobertura da tela com
+  somas de prefixos e pinta direto nos pixels (pygame.surfarray)
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+MAX_TEXTOS = 256  # superfícies de texto guardadas por Renderizador
+
+
+class Renderizador:
+    def __init__(self, tela, fundo, limite_retangulos=256):
+        self.tela = tela
+        self.fundo = fundo
+        self.limite = limite_retangulos
+        self._fontes = {}
+        self._textos = OrderedDict()
+        self._anteriores = []
+        self._atuais = []
+        self._redesenhar_tudo = True  # o primeiro quadro sempre pinta e apresenta tudo
+        self._estourou = False
+
+    def invalidar(self):
+        """Força o próximo quadro a redesenhar e apresentar a tela inteira."""
+        self._redesenhar_tudo = True
+
+    def inicio_quadro(self):
+        if self._redesenhar_tudo:
+            self.tela.fill(self.fundo)
+        else:
+            for r in self._anteriores:
+                self.tela.fill(self.fundo, r)
+        self._atuais = []
+        self._estourou = False
+
+    def _marcar(self, r):
+        if not self._estourou:
+            self._atuais.append(r)
+            if len(self._atuais) > self.limite:
+                self._estourar()
+        return r
+
+    def _estourar(self):
+        # retângulos demais: deixa de anotar, este quadro apresenta com flip e o próximo limpa tudo
+        self._estourou = True
+        self._atuais = []
+
+    # ---------- caches de texto ----------
+    def fonte(self, tamanho, nome=None, sistema=False):
+        chave = (tamanho, nome, sistema)
+        if chave not in self._fontes:
+            if sistema:
+                self._fontes[chave] = pygame.font.SysFont(nome, tamanho)
+            else:
+                self._fontes[chave] = pygame.font.Font(nome, tamanho)
+        return self._fontes[chave]
+
+    def superficie_texto(self, conteudo, tamanho, cor, sistema=False):
+        chave = (conteudo, tamanho, cor, sistema)
+        superficie = self._textos.get(chave)
+        if superficie is None:
+            superficie = self.fonte(tamanho, None, sistema).render(conteudo, True, cor)
+            self._textos[chave] = superficie
+            if len(self._textos) > MAX_TEXTOS:
+                self._textos.popitem(last=False)
+        else:
+            self._textos.move_to_end(chave)
+        return superficie
+
+    # ---------- primitivas ----------
+    def rect(self, cor, retangulo):
+        return self._marcar(pygame.draw.rect(self.tela, cor, retangulo))
+
+    def circulo(self, cor, centro, raio):
+        return self._marcar(pygame.draw.circle(self.tela, cor, centro, raio))
+
+    def blit(self, superficie, posicao):
+        return self._marcar(self.tela.blit(superficie, posicao))
+
+    def blits(self, superficie, posicoes):
+        if self._estourou or len(self._atuais) + len(posicoes) > self.limite:
+            self._estourar()
+            self.tela.blits([(superficie, p) for p in posicoes], False)
+        else:
+            self._atuais.extend(self.tela.blits([(superficie, p) for p in posicoes]))
+
+    def quadrados(self, cor, cantos, tamanho):
+        """Quadrados tamanho × tamanho da mesma cor; cantos: array (N, 2) de x, y inteiros."""
+        if not len(cantos):
+            return
+        if not self._estourou and len(self._atuais) + len(cantos) <= self.limite:
+            for x, y in cantos.tolist():
+                self._atuais.append(self.tela.fill(cor, (x, y, tamanho, tamanho)))
+            return
+        self._estourar()
+        try:
+            pixels = pygame.surfarray.pixels2d(self.tela)
+        except ValueError:  # tela de 24 bits não tem array 2D
+            for x, y in cantos.tolist():
+                self.tela.fill(cor, (x, y, tamanho, tamanho))
+            return
+        np.copyto(pixels, self.tela.map_rgb(cor), where=self._cobertura(cantos, tamanho).T)
+        del pixels  # solta a trava da superfície antes do flip
+
+    def _cobertura(self, cantos, tamanho):
+        """Máscara (altura, largura) dos pixels cobertos: +1/-1 nos quatro cantos de cada
+        quadrado e somas acumuladas nos dois eixos, em vez de pintar quadrado por quadrado."""
+        largura, altura = self.tela.get_size()
+        w = largura + 1
+        x0 = np.clip(cantos[:, 0], 0, largura)
+        y0 = np.clip(cantos[:, 1], 0, altura)
+        x1 = np.clip(cantos[:, 0] + tamanho, 0, largura)
+        y1 = np.clip(cantos[:, 1] + tamanho, 0, altura)
+        n = (altura + 1) * w
+        # nenhum pixel é coberto mais de len(cantos) vezes: int16 basta até 32.767 quadrados
+        # (metade da memória para as duas passadas, que é o que custa)
+        tipo = np.int16 if len(cantos) <= np.iinfo(np.int16).max else np.int32
+        soma = np.bincount(np.concatenate([y0 * w + x0, y1 * w + x1]), minlength=n).astype(tipo)
+        soma -= np.bincount(np.concatenate([y0 * w + x1, y1 * w + x0]), minlength=n).astype(tipo)
+        # horizontal: cada linha soma zero (o +1 e o -1 de um quadrado estão na mesma linha),
+        # então uma soma acumulada do array inteiro, contíguo, vale por uma por linha
+        np.cumsum(soma, out=soma)
+        soma = soma.reshape(altura + 1, w)
+        np.cumsum(soma, axis=0, out=soma)
+        return soma[:altura, :largura] > 0
+
+    def texto(self, conteudo, tamanho, cor, posicao=None, centro_x=None, sistema=False):
+        """Desenha texto em cache; com centro_x o texto é centralizado horizontalmente."""
+        superficie = self.superficie_texto(conteudo, tamanho, cor, sistema)
+        x, y = posicao if posicao is not None else (0, 0)
+        if centro_x is not None:
+            x = centro_x - superficie.get_width() // 2
+        return self.blit(superficie, (x, y))
+
+    # ---------- fim do quadro ----------
+    def apresentar(self):
+        if self._redesenhar_tudo or self._estourou:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._anteriores + self._atuais)
+        # o que foi desenhado agora é o que o próximo quadro precisa apagar
+        self._redesenhar_tudo = self._estourou
+        self._anteriores = self._atuais
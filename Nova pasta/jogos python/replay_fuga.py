@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+replay_fuga.py
+Gravação e replay determinístico de partidas do fuga.py.
+
+Uma partida do fuga depende só da semente dos bixinhos e das setas apertadas em
+cada quadro (ver JogoFuga), então a gravação guarda só isso:
+
+  cabeçalho (struct FORMATO_CABECALHO): MAGIC, versão, flags, semente,
+      quadros, bixinhos fixos (0 = um por fase), assinatura do estado final,
+      tamanho dos dados
+  dados: 4 bits por quadro (esquerda, direita, cima, baixo), dois quadros por
+      byte, comprimidos com zlib se FLAG_ZLIB (partidas paradas viram quase nada)
+
+O Replay re-simula sem tela e sem limite de FPS, guardando um checkpoint do
+estado a cada `intervalo` quadros: ir_para(quadro) volta ao checkpoint anterior
+mais próximo e simula só o resto. Ao fim, a assinatura do estado tem que bater
+com a gravada: se uma otimização mudar a jogabilidade, o replay acusa.
+
+Uso:
+  python fuga.py --gravar sessao.fuga
+  python replay_fuga.py sessao.fuga
+  python replay_fuga.py sessao.fuga --perfil 10 --desenhar
+  python replay_fuga.py sessao.fuga --ir-para 1800
+"""
+
+import argparse
+import bisect
+import struct
+import time
+import zlib
+
+import numpy as np
+import pygame
+
+from fuga import JogoFuga, LARGURA, ALTURA
+from headless import TeclasScript, configurar_headless
+
+MAGIC = b"FUGA"
+VERSAO = 1
+FORMATO_CABECALHO = "<4sBBxxQIIII"
+FLAG_ZLIB = 1
+
+# bit de cada tecla nos 4 bits do quadro
+BITS_TECLAS = ((1, pygame.K_LEFT), (2, pygame.K_RIGHT), (4, pygame.K_UP), (8, pygame.K_DOWN))
+# as 16 combinações possíveis, prontas para passar a JogoFuga.atualizar()
+_TECLAS = [TeclasScript([tecla for bit, tecla in BITS_TECLAS if bits & bit]) for bits in range(16)]
+
+
+def bits_das_teclas(teclas):
+    bits = 0
+    for bit, tecla in BITS_TECLAS:
+        if teclas[tecla]:
+            bits |= bit
+    return bits
+
+
+def assinatura(jogo):
+    """CRC32 do estado que importa para a jogabilidade (jogador, fase, quadro e bixinhos)."""
+    crc = zlib.crc32(struct.pack("<4iIII", *jogo.jogador, jogo.quadro, jogo.fase, jogo.inicio_fase))
+    return zlib.crc32(np.ascontiguousarray(jogo.bixinhos.pos).tobytes(), crc)
+
+
+def _empacotar(entradas):
+    bits = np.frombuffer(bytes(entradas), dtype=np.uint8)
+    if len(bits) % 2:
+        bits = np.append(bits, np.uint8(0))
+    return (bits[0::2] | (bits[1::2] << 4)).tobytes()
+
+
+def _desempacotar(dados, quadros):
+    pares = np.frombuffer(dados, dtype=np.uint8)
+    bits = np.empty(len(pares) * 2, dtype=np.uint8)
+    bits[0::2] = pares & 0x0F
+    bits[1::2] = pares >> 4
+    return bits[:quadros].tobytes()
+
+
+# ===============================
+# 🔹 Gravação
+# ===============================
+class Gravador:
+    """Acumula as teclas de cada quadro (um byte por quadro na memória; metade disso no arquivo)."""
+
+    def __init__(self, semente, bixinhos=None):
+        self.semente = semente
+        self.bixinhos = bixinhos
+        self.entradas = bytearray()
+
+    def __len__(self):
+        return len(self.entradas)
+
+    def registrar(self, teclas):
+        self.entradas.append(bits_das_teclas(teclas))
+
+    def salvar(self, arquivo, jogo, comprimir=True):
+        """jogo: a partida no último quadro gravado (a assinatura dela vai no cabeçalho)."""
+        dados = _empacotar(self.entradas)
+        flags = 0
+        if comprimir:
+            dados, flags = zlib.compress(dados, 9), FLAG_ZLIB
+        cabecalho = struct.pack(FORMATO_CABECALHO, MAGIC, VERSAO, flags, self.semente, len(self.entradas),
+                                self.bixinhos or 0, assinatura(jogo), len(dados))
+        with open(arquivo, "wb") as f:
+            f.write(cabecalho)
+            f.write(dados)
+
+
+class Gravacao:
+    __slots__ = ("semente", "quadros", "bixinhos", "assinatura", "entradas")
+
+    def __init__(self, semente, quadros, bixinhos, assinatura, entradas):
+        self.semente = semente
+        self.quadros = quadros
+        self.bixinhos = bixinhos
+        self.assinatura = assinatura
+        self.entradas = entradas  # bytes, os 4 bits de cada quadro
+
+
+def carregar_gravacao(arquivo):
+    with open(arquivo, "rb") as f:
+        conteudo = f.read()
+    tamanho = struct.calcsize(FORMATO_CABECALHO)
+    magic, versao, flags, semente, quadros, bixinhos, crc, n = struct.unpack_from(FORMATO_CABECALHO, conteudo)
+    if magic != MAGIC:
+        raise ValueError(f"{arquivo} não é uma gravação do fuga")
+    if versao != VERSAO:
+        raise ValueError(f"{arquivo}: versão {versao} da gravação não suportada")
+    dados = conteudo[tamanho:tamanho + n]
+    if flags & FLAG_ZLIB:
+        dados = zlib.decompress(dados)
+    return Gravacao(semente, quadros, bixinhos or None, crc, _desempacotar(dados, quadros))
+
+
+def teclas_do_quadro(gravacao, quadro):
+    """Teclas do quadro (contado a partir de 0), no formato de pygame.key.get_pressed()."""
+    return _TECLAS[gravacao.entradas[quadro]]
+
+
+# ===============================
+# 🔹 Replay
+# ===============================
+class Replay:
+    """Re-simula uma gravação. replay.jogo é a partida no quadro replay.quadro.
+
+    tela=None roda só as regras; com uma tela, replay.jogo.desenhar() também funciona."""
+
+    def __init__(self, gravacao, intervalo=600, tela=None):
+        self.gravacao = gravacao
+        self.intervalo = intervalo
+        self.jogo = JogoFuga(tela, bixinhos=gravacao.bixinhos, semente=gravacao.semente)
+        self.vivo = True
+        self._quadros_checkpoint = [0]
+        self._checkpoints = [(self.jogo.estado(), True)]
+
+    @property
+    def quadro(self):
+        return self.jogo.quadro
+
+    @property
+    def fim(self):
+        return not self.vivo or self.jogo.quadro >= self.gravacao.quadros
+
+    def avancar(self, n=1):
+        """Simula até n quadros (para antes se a gravação ou a partida acabar)."""
+        jogo, entradas, intervalo = self.jogo, self.gravacao.entradas, self.intervalo
+        ultimo = min(jogo.quadro + n, self.gravacao.quadros)
+        while self.vivo and jogo.quadro < ultimo:
+            self.vivo = jogo.atualizar(_TECLAS[entradas[jogo.quadro]])
+            if jogo.quadro % intervalo == 0 and jogo.quadro > self._quadros_checkpoint[-1]:
+                self._quadros_checkpoint.append(jogo.quadro)
+                self._checkpoints.append((jogo.estado(), self.vivo))
+
+    def ir_para(self, quadro):
+        """Deixa o jogo no estado logo depois do quadro `quadro` (0 = início)."""
+        quadro = max(0, min(quadro, self.gravacao.quadros))
+        i = bisect.bisect_right(self._quadros_checkpoint, quadro) - 1
+        base = self._quadros_checkpoint[i]
+        # se o jogo já está entre o checkpoint e o destino, é mais barato seguir dali
+        if not base <= self.jogo.quadro <= quadro:
+            estado, self.vivo = self._checkpoints[i]
+            self.jogo.restaurar(estado)
+        self.avancar(quadro - self.jogo.quadro)
+
+    def ate_o_fim(self):
+        self.avancar(self.gravacao.quadros - self.jogo.quadro)
+
+    def confere(self):
+        """True se o estado no fim da gravação é o mesmo da partida gravada."""
+        return self.jogo.quadro == self.gravacao.quadros and assinatura(self.jogo) == self.gravacao.assinatura
+
+
+# ===============================
+# 🔹 Linha de comando
+# ===============================
+def perfil(replay, quantos, desenhar=False):
+    """Re-simula do início medindo cada quadro; mostra os `quantos` mais lentos."""
+    replay.ir_para(0)
+    tempos = []
+    while not replay.fim:
+        t0 = time.perf_counter()
+        replay.avancar(1)
+        if desenhar:
+            replay.jogo.desenhar()
+            replay.jogo.apresentar()
+        tempos.append((time.perf_counter() - t0, replay.quadro, replay.jogo.fase, len(replay.jogo.bixinhos)))
+    tempos.sort(reverse=True)
+    print(f"{quantos} quadros mais lentos ({'atualizar + desenhar' if desenhar else 'atualizar'}):")
+    for duracao, quadro, fase, bixinhos in tempos[:quantos]:
+        print(f"  quadro {quadro:7d} | fase {fase} | {bixinhos:6d} bixinhos | {duracao * 1000:7.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay de partidas gravadas do fuga.py")
+    parser.add_argument("arquivo")
+    parser.add_argument("--intervalo", type=int, default=600, help="quadros entre checkpoints")
+    parser.add_argument("--ir-para", type=int, metavar="QUADRO", help="mostra o estado da partida nesse quadro")
+    parser.add_argument("--perfil", type=int, metavar="K", help="lista os K quadros mais lentos")
+    parser.add_argument("--desenhar", action="store_true", help="inclui a renderização (sem janela) no perfil")
+    args = parser.parse_args()
+
+    gravacao = carregar_gravacao(args.arquivo)
+    tela = None
+    if args.desenhar:
+        configurar_headless()
+        pygame.init()
+        tela = pygame.display.set_mode((LARGURA, ALTURA))
+    replay = Replay(gravacao, args.intervalo, tela)
+
+    inicio = time.perf_counter()
+    replay.ate_o_fim()
+    duracao = time.perf_counter() - inicio
+    print(f"{args.arquivo}: semente {gravacao.semente}, {gravacao.quadros} quadros "
+          f"({gravacao.quadros / 60:.1f}s de jogo), fase final {replay.jogo.fase}")
+    print(f"  re-simulado em {duracao:.2f}s ({replay.quadro / duracao:,.0f} quadros/s, "
+          f"{replay.quadro / 60 / duracao:,.0f}x tempo real), {len(replay._checkpoints)} checkpoints")
+    if replay.confere():
+        print("  estado final confere com a gravação")
+    else:
+        print(f"  ATENÇÃO: estado final diferente da gravação (parou no quadro {replay.quadro})")
+
+    if args.ir_para is not None:
+        inicio = time.perf_counter()
+        replay.ir_para(args.ir_para)
+        jogo = replay.jogo
+        print(f"quadro {replay.quadro} ({(time.perf_counter() - inicio) * 1000:.1f} ms para chegar): "
+              f"fase {jogo.fase}, tempo {jogo.tempo_passado}/{jogo.tempo_limite()}, "
+              f"jogador em ({jogo.jogador.x}, {jogo.jogador.y}), {len(jogo.bixinhos)} bixinhos")
+
+    if args.perfil:
+        perfil(replay, args.perfil, args.desenhar)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+test_inimigos.py
+Testes do enxame de perseguidores (rodar com: python -m pytest)."""
+
+import random
+
+import numpy as np
+
+from inimigos import Enxame
+
+
+def amontoados(enxame):
+    """Fração dos pares de bixinhos que dividem mais da metade da área."""
+    p, t = enxame.pos, enxame.tamanho
+    dx = np.abs(p[:, None, 0] - p[None, :, 0])
+    dy = np.abs(p[:, None, 1] - p[None, :, 1])
+    area = np.clip(t - dx, 0, None) * np.clip(t - dy, 0, None) / (t * t)
+    return (area[np.triu_indices(len(p), 1)] > 0.5).mean()
+
+
+def perseguir(**opcoes):
+    """200 bixinhos perseguindo por 600 quadros um alvo parado no meio da tela."""
+    enxame = Enxame.gerar(200, 800, 600, random.Random(1), **opcoes)
+    for _ in range(600):
+        enxame.mover(400, 300)
+    return enxame
+
+
+def test_separacao_espalha_o_enxame():
+    sem = amontoados(perseguir(separacao=0))
+    com = amontoados(perseguir())
+    assert sem > 0.9  # sem separação todos viram um bloco em cima do alvo
+    assert com < 0.02
+
+
+def test_bixinhos_na_mesma_posicao_se_separam():
+    enxame = Enxame([(400, 300)] * 20, 800, 600)
+    for _ in range(120):
+        enxame.mover(400, 300)
+    assert len(np.unique(enxame.pos.astype(np.int32), axis=0)) == 20
+    assert amontoados(enxame) < 0.1
+
+
+def test_colide_com_a_grade():
+    enxame = Enxame([(100, 100), (500, 400)], 800, 600, separacao=0)
+    enxame.atualizar_grade()
+    assert enxame.colide((110, 110, 10, 10))
+    assert not enxame.colide((300, 300, 10, 10))
+    assert list(enxame.consultar(480, 380, 30, 30)) == [1]
@@ -0,0 +1,74 @@
+"""
+test_jogos.py
+Testes dos jogos pygame sem janela (rodar com: python -m pytest)."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+PASTA = os.path.dirname(os.path.abspath(__file__))
+
+
+def rodar(codigo):
+    """Roda o código num processo separado: um segfault do SDL não derruba o pytest."""
+    ambiente = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    return subprocess.run([sys.executable, "-c", codigo], cwd=PASTA, env=ambiente,
+                          capture_output=True, text=True, timeout=120)
+
+
+@pytest.mark.parametrize("modulo, opcoes", [("raquete", ""), ("fuga", ", semente=1")])
+def test_jogo_duas_vezes_no_mesmo_processo(modulo, opcoes):
+    # pygame.quit() no fim de jogo() invalida as fontes; a segunda partida não pode reusá-las.
+    # 70 quadros: o cronômetro do fuga passa de 0 para 1 s e força renderizar um texto novo
+    resultado = rodar(f"import {modulo}\n"
+                      f"{modulo}.jogo(headless=True, quadros=5, sem_limite=True{opcoes})\n"
+                      f"{modulo}.jogo(headless=True, quadros=70, sem_limite=True{opcoes})\n")
+    assert resultado.returncode == 0, resultado.stderr
+
+
+@pytest.mark.parametrize("modulo", ["raquete", "fuga"])
+def test_headless_usa_video_e_audio_dummy(modulo):
+    resultado = rodar("import os\n"
+                      "for variavel in ('SDL_VIDEODRIVER', 'SDL_AUDIODRIVER'):\n"
+                      "    os.environ.pop(variavel, None)\n"
+                      f"import {modulo}\n"
+                      f"{modulo}.jogo(headless=True, quadros=1, sem_limite=True)\n"
+                      "assert os.environ['SDL_VIDEODRIVER'] == os.environ['SDL_AUDIODRIVER'] == 'dummy'\n")
+    assert resultado.returncode == 0, resultado.stderr
+
+
+def test_texto_depois_de_reiniciar_o_pygame():
+    resultado = rodar("import pygame\n"
+                      "from renderizacao import Renderizador\n"
+                      "for conteudo in ('a', 'b'):\n"
+                      "    pygame.init()\n"
+                      "    render = Renderizador(pygame.display.set_mode((100, 100)), (0, 0, 0))\n"
+                      "    render.texto(conteudo, 36, (255, 255, 255), (0, 0))\n"
+                      "    pygame.quit()\n")
+    assert resultado.returncode == 0, resultado.stderr
+
+
+def test_quadrados_pinta_o_mesmo_que_um_fill_por_quadrado():
+    # 2000 quadrados passam do limite de retângulos sujos: vão pelos pixels da tela
+    resultado = rodar("import random\n"
+                      "import numpy as np, pygame\n"
+                      "from renderizacao import Renderizador\n"
+                      "pygame.init()\n"
+                      "tela = pygame.display.set_mode((200, 150))\n"
+                      "rng = random.Random(0)\n"
+                      "cantos = np.array([(rng.randint(-20, 200), rng.randint(-20, 150)) for _ in range(2000)])\n"
+                      "esperado = pygame.Surface(tela.get_size()).convert()\n"
+                      "esperado.fill((255, 255, 255))\n"
+                      "for x, y in cantos.tolist():\n"
+                      "    esperado.fill((255, 0, 0), (x, y, 30, 30))\n"
+                      "for n in (2000, 5):\n"
+                      "    render = Renderizador(tela, (255, 255, 255))\n"
+                      "    render.inicio_quadro()\n"
+                      "    render.quadrados((255, 0, 0), cantos[:n], 30)\n"
+                      "    render.apresentar()\n"
+                      "    if n == 2000:\n"
+                      "        assert (pygame.surfarray.array2d(tela) == pygame.surfarray.array2d(esperado)).all()\n"
+                      "assert len(render._anteriores) == 5\n")
+    assert resultado.returncode == 0, resultado.stderr
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+torneio_raquete.py
+Torneio headless entre IAs do jogo de raquete, em paralelo num pool de processos.
+
+Cada partida i usa random.Random(semente * 2**32 + i) para saque e erro das IAs:
+o resultado do torneio não depende de quantos processos foram usados.
+Não importa pygame: só raquete_regras/raquete_fisica.
+
+Uso:
+  python torneio_raquete.py --partidas 5000
+  python torneio_raquete.py --partidas 2000 --ia-esquerda preditiva:30 --ia-direita seguidora --pontos 7
+"""
+
+import argparse
+import random
+import statistics
+import time
+from collections import Counter
+from multiprocessing import Pool
+
+from raquete_fisica import PASSO, bola_VELOCIDADE
+from raquete_regras import criar_ia, jogar_partida
+
+
+def _jogar_bloco(tarefa):
+    inicio, fim, semente, ia_esquerda, ia_direita, pontos, max_passos, velocidade = tarefa
+    resultados = []
+    for i in range(inicio, fim):
+        rng = random.Random(semente * 2**32 + i)
+        partida = jogar_partida(criar_ia(ia_esquerda, rng), criar_ia(ia_direita, rng), rng,
+                                pontos, max_passos, velocidade)
+        resultados.append((partida.pontos_esquerda, partida.pontos_direita, partida.passos))
+    return resultados
+
+
+def torneio(partidas, ia_esquerda, ia_direita, semente=0, processos=None, bloco=50,
+            pontos=5, max_passos=120 * 60 * 10, velocidade=bola_VELOCIDADE):
+    """Joga as partidas e retorna a lista de (pontos_esquerda, pontos_direita, passos), em ordem."""
+    tarefas = [(i, min(i + bloco, partidas), semente, ia_esquerda, ia_direita, pontos, max_passos, velocidade)
+               for i in range(0, partidas, bloco)]
+    if processos == 1:
+        blocos = map(_jogar_bloco, tarefas)
+        return [r for resultado in blocos for r in resultado]
+    with Pool(processos) as pool:
+        return [r for resultado in pool.imap(_jogar_bloco, tarefas) for r in resultado]
+
+
+def relatorio(resultados, duracao, ia_esquerda, ia_direita):
+    n = len(resultados)
+    vitorias_e = sum(1 for e, d, _ in resultados if e > d)
+    vitorias_d = sum(1 for e, d, _ in resultados if d > e)
+    passos = [p for _, _, p in resultados]
+    pontos = sum(e + d for e, d, _ in resultados)
+    total_passos = sum(passos)
+
+    print(f"{n} partidas: {ia_esquerda} (esquerda) x {ia_direita} (direita)")
+    print(f"  {duracao:.2f}s | {n / duracao:,.0f} partidas/s | {total_passos / duracao:,.0f} passos/s "
+          f"({total_passos * PASSO / duracao:,.0f}x tempo real)")
+    print(f"  vitórias: esquerda {vitorias_e / n:.1%} | direita {vitorias_d / n:.1%} | "
+          f"empates (limite de passos) {(n - vitorias_e - vitorias_d) / n:.1%}")
+    print(f"  duração da partida: média {statistics.fmean(passos) * PASSO:.1f}s de jogo | "
+          f"mediana {statistics.median(passos) * PASSO:.1f}s")
+    if pontos:
+        print(f"  tempo médio por ponto: {total_passos * PASSO / pontos:.1f}s de jogo")
+    print("  placares mais comuns:")
+    for (e, d), quantidade in Counter((e, d) for e, d, _ in resultados).most_common(8):
+        print(f"    {e} - {d}: {quantidade:6d} ({quantidade / n:.1%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Torneio headless de IAs do jogo de raquete")
+    parser.add_argument("--partidas", type=int, default=1000)
+    parser.add_argument("--ia-esquerda", default="preditiva:40", help="seguidora, preditiva ou preditiva:ERRO")
+    parser.add_argument("--ia-direita", default="preditiva:60")
+    parser.add_argument("--pontos", type=int, default=5, help="pontos para vencer a partida")
+    parser.add_argument("--max-segundos", type=float, default=600, help="limite de tempo de jogo por partida")
+    parser.add_argument("--velocidade", type=float, default=bola_VELOCIDADE, help="velocidade da bola em px/s por eixo")
+    parser.add_argument("--processos", type=int, default=None, help="processos do pool (padrão: núcleos da CPU)")
+    parser.add_argument("--bloco", type=int, default=50, help="partidas por tarefa enviada a cada processo")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    resultados = torneio(args.partidas, args.ia_esquerda, args.ia_direita, args.semente, args.processos,
+                         args.bloco, args.pontos, int(args.max_segundos / PASSO), args.velocidade)
+    relatorio(resultados, time.perf_counter() - inicio, args.ia_esquerda, args.ia_direita)
+
+
+if __name__ == "__main__":
+    main()